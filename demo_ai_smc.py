@@ -6,6 +6,7 @@ Demonstrates the institutional-grade SMC analysis capabilities
 
 import sys
 import os
+import zlib
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -24,51 +25,63 @@ except ImportError as e:
     print("Make sure AI-SMC package is properly set up")
     sys.exit(1)
 
+def _demo_seed(symbol: str, periods: int) -> int:
+    """Stable RNG seed for a (symbol, periods) pair (``hash()`` is salted per process)"""
+    return zlib.crc32(f"{symbol}:{periods}".encode())
+
+# Timeframe -> (pandas resample rule, M15 bars per bar)
+TIMEFRAME_RESAMPLE = {
+    'H4': ('4h', 16),
+    'H1': ('1h', 4),
+    'M15': ('15min', 1),
+}
+
+OHLC_AGGREGATION = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
 def generate_sample_data(symbol: str = "EURUSD", periods: int = 500) -> dict:
-    """Generate sample OHLC data for testing"""
+    """
+    Generate sample OHLC data for testing
+
+    A single M15 series is generated and H1/H4 are resampled from it, so the
+    three timeframes describe the same price path. Data is seeded per
+    (symbol, periods), so repeated demo runs produce identical bars and
+    comparable detector output.
+    """
     print(f"📊 Generating sample data for {symbol}")
+    rng = np.random.default_rng(_demo_seed(symbol, periods))
     
     # Base price
     base_price = 1.1000 if 'EUR' in symbol else 1.0000
     
-    # Generate realistic price data
-    dates = pd.date_range(end=datetime.now(), periods=periods, freq='1H')
+    # Bars requested per timeframe
+    tf_periods = {}
+    for timeframe in TIMEFRAME_RESAMPLE:
+        bars = periods // (4 if timeframe == 'H4' else 1 if timeframe == 'H1' else periods * 4)
+        tf_periods[timeframe] = max(100, min(bars, 1000))  # Reasonable range
     
-    data = {}
+    # Enough M15 bars to cover the longest timeframe, aligned to H4 boundaries
+    base_bars = max(tf_periods[tf] * factor for tf, (_, factor) in TIMEFRAME_RESAMPLE.items())
+    end = pd.Timestamp(datetime.now()).floor('4h') - pd.Timedelta(minutes=15)
+    dates = pd.date_range(end=end, periods=base_bars, freq='15min')
     
-    for timeframe in ['H4', 'H1', 'M15']:
-        # Adjust periods based on timeframe
-        tf_periods = periods // (4 if timeframe == 'H4' else 1 if timeframe == 'H1' else periods * 4)
-        tf_periods = max(100, min(tf_periods, 1000))  # Reasonable range
-        
-        # Generate price movement
-        returns = np.random.normal(0, 0.001, tf_periods)  # Small returns
-        prices = base_price * np.exp(np.cumsum(returns))
-        
-        # Create OHLC from prices
-        ohlc_data = []
-        for i in range(len(prices)):
-            price = prices[i]
-            volatility = np.random.uniform(0.0005, 0.002)
-            
-            high = price + volatility * np.random.uniform(0.3, 1.0)
-            low = price - volatility * np.random.uniform(0.3, 1.0)
-            open_price = price + np.random.uniform(-volatility/2, volatility/2)
-            close = price + np.random.uniform(-volatility/2, volatility/2)
-            volume = np.random.randint(1000, 10000)
-            
-            ohlc_data.append({
-                'Open': open_price,
-                'High': high,
-                'Low': low,
-                'Close': close,
-                'Volume': volume
-            })
-        
-        tf_dates = pd.date_range(end=datetime.now(), periods=tf_periods, 
-                               freq='4H' if timeframe == 'H4' else '1H' if timeframe == 'H1' else '15T')
-        
-        data[timeframe] = pd.DataFrame(ohlc_data, index=tf_dates)
+    # Generate price movement
+    returns = rng.normal(0, 0.001, base_bars)  # Small returns
+    prices = base_price * np.exp(np.cumsum(returns))
+    
+    # Create OHLC from prices
+    volatility = rng.uniform(0.0005, 0.002, base_bars)
+    base = pd.DataFrame({
+        'Open': prices + rng.uniform(-volatility/2, volatility/2),
+        'High': prices + volatility * rng.uniform(0.3, 1.0, base_bars),
+        'Low': prices - volatility * rng.uniform(0.3, 1.0, base_bars),
+        'Close': prices + rng.uniform(-volatility/2, volatility/2),
+        'Volume': rng.integers(1000, 10000, base_bars)
+    }, index=dates)
+    
+    data = {}
+    for timeframe, (rule, factor) in TIMEFRAME_RESAMPLE.items():
+        bars = base if factor == 1 else base.resample(rule).agg(OHLC_AGGREGATION)
+        data[timeframe] = bars.tail(tf_periods[timeframe])
     
     return data
 
@@ -114,14 +127,17 @@ def demonstrate_smc_analysis():
             
             # Timeframe analysis
             timeframe_analysis = analysis.get('timeframe_analysis', {})
-            print(f"\n📊 TIMEFRAME ANALYSIS:")
+            out = [f"\n📊 TIMEFRAME ANALYSIS:"]
             for tf, tf_analysis in timeframe_analysis.items():
-                print(f"   {tf} Timeframe:")
-                print(f"     • Order Blocks: {len(tf_analysis.get('order_blocks', []))}")
-                print(f"     • Fair Value Gaps: {len(tf_analysis.get('fair_value_gaps', []))}")
-                print(f"     • Liquidity Zones: {len(tf_analysis.get('liquidity_zones', []))}")
-                print(f"     • CHoCH Signals: {len(tf_analysis.get('choch_signals', []))}")
-                print(f"     • MSS Signals: {len(tf_analysis.get('mss_signals', []))}")
+                out += [
+                    f"   {tf} Timeframe:",
+                    f"     • Order Blocks: {len(tf_analysis.get('order_blocks', []))}",
+                    f"     • Fair Value Gaps: {len(tf_analysis.get('fair_value_gaps', []))}",
+                    f"     • Liquidity Zones: {len(tf_analysis.get('liquidity_zones', []))}",
+                    f"     • CHoCH Signals: {len(tf_analysis.get('choch_signals', []))}",
+                    f"     • MSS Signals: {len(tf_analysis.get('mss_signals', []))}",
+                ]
+            print('\n'.join(out))
             
             # SMC Confluence
             confluence = analysis.get('smc_confluence', {})
@@ -133,14 +149,17 @@ def demonstrate_smc_analysis():
             
             # Signals
             signals = analysis.get('signals', [])
-            print(f"\n📡 GENERATED SIGNALS: {len(signals)}")
+            out = [f"\n📡 GENERATED SIGNALS: {len(signals)}"]
             for i, signal in enumerate(signals[:3]):  # Show first 3 signals
                 quality_score = signal.get('quality_score', 0) * 100
-                print(f"   Signal {i+1}:")
-                print(f"     • Type: {signal.get('type', 'UNKNOWN')}")
-                print(f"     • Entry: {signal.get('entry_price', 0):.5f}")
-                print(f"     • Quality: {quality_score:.1f}%")
-                print(f"     • Confluence: {signal.get('confluence_score', 0):.1f}")
+                out += [
+                    f"   Signal {i+1}:",
+                    f"     • Type: {signal.get('type', 'UNKNOWN')}",
+                    f"     • Entry: {signal.get('entry_price', 0):.5f}",
+                    f"     • Quality: {quality_score:.1f}%",
+                    f"     • Confluence: {signal.get('confluence_score', 0):.1f}",
+                ]
+            print('\n'.join(out))
             
             # Get market bias
             bias = analyzer.get_market_bias(symbol, symbol_data)
@@ -163,17 +182,20 @@ def demonstrate_smc_analysis():
     try:
         opportunities = analyzer.get_trading_opportunities(symbols, sample_data_provider)
         
-        print(f"🎯 FOUND {len(opportunities)} TRADING OPPORTUNITIES:")
+        out = [f"🎯 FOUND {len(opportunities)} TRADING OPPORTUNITIES:"]
         for i, opp in enumerate(opportunities[:5]):  # Show top 5
             signal = opp['signal']
             quality_grade = opp['quality_grade']
             
-            print(f"\n   Opportunity #{i+1}:")
-            print(f"     Symbol: {opp['symbol']}")
-            print(f"     Quality Grade: {quality_grade.value}")
-            print(f"     Quality Score: {signal.get('quality_score', 0)*100:.1f}%")
-            print(f"     Type: {signal.get('type', 'UNKNOWN')}")
-            print(f"     Confluence: {signal.get('confluence_score', 0):.1f}")
+            out += [
+                f"\n   Opportunity #{i+1}:",
+                f"     Symbol: {opp['symbol']}",
+                f"     Quality Grade: {quality_grade.value}",
+                f"     Quality Score: {signal.get('quality_score', 0)*100:.1f}%",
+                f"     Type: {signal.get('type', 'UNKNOWN')}",
+                f"     Confluence: {signal.get('confluence_score', 0):.1f}",
+            ]
+        print('\n'.join(out))
             
     except Exception as e:
         print(f"❌ Error scanning opportunities: {str(e)}")
@@ -6,46 +6,61 @@ Tests the core functionality of the AI-SMC system
 
 import sys
 import os
+import zlib
 from pathlib import Path
-import pandas as pd
-import numpy as np
 from datetime import datetime
 
 # Add AI-SMC to path
 ai_smc_path = Path(__file__).parent / "AI-SMC"
 sys.path.insert(0, str(ai_smc_path))
 
-def generate_realistic_ohlc(periods=200, base_price=1.1000):
-    """Generate realistic OHLC data for testing"""
-    dates = pd.date_range(start='2024-01-01', periods=periods, freq='1h')
+def _demo_seed(symbol, periods):
+    """Stable RNG seed for a (symbol, periods) pair (``hash()`` is salted per process)"""
+    return zlib.crc32(f"{symbol}:{periods}".encode())
+
+def generate_realistic_ohlc(periods=200, base_price=1.1000, symbol="EURUSD", freq='1h'):
+    """
+    Generate realistic OHLC data for testing
+
+    Seeded per (symbol, periods) so the demo is reproducible across runs.
+    """
+    # Imported here so that loading the demo module stays cheap
+    import numpy as np
+    import pandas as pd
+    
+    rng = np.random.default_rng(_demo_seed(symbol, periods))
+    dates = pd.date_range(start='2024-01-01', periods=periods, freq=freq)
     
     # Generate price series with some trending behavior
-    returns = np.random.normal(0, 0.0005, periods)
-    prices = [base_price]
-    for ret in returns[1:]:
-        prices.append(prices[-1] * (1 + ret))
+    returns = rng.normal(0, 0.0005, periods)
+    returns[0] = 0.0
+    prices = base_price * np.cumprod(1 + returns)
     
-    # Create OHLC from price series
-    ohlc_data = []
-    for i, price in enumerate(prices):
-        # Add some intrabar volatility
-        volatility = np.random.uniform(0.0001, 0.0008)
-        
-        open_price = price + np.random.uniform(-volatility/2, volatility/2)
-        close_price = price + np.random.uniform(-volatility/2, volatility/2)
-        high_price = max(open_price, close_price) + np.random.uniform(0, volatility)
-        low_price = min(open_price, close_price) - np.random.uniform(0, volatility)
-        volume = np.random.randint(1000, 10000)
-        
-        ohlc_data.append({
-            'Open': open_price,
-            'High': high_price,
-            'Low': low_price,
-            'Close': close_price,
-            'Volume': volume
-        })
+    # Create OHLC from price series with some intrabar volatility
+    volatility = rng.uniform(0.0001, 0.0008, periods)
+    open_ = prices + rng.uniform(-volatility/2, volatility/2)
+    close = prices + rng.uniform(-volatility/2, volatility/2)
+    high = np.maximum.reduce([open_, close]) + rng.uniform(0, volatility)
+    low = np.minimum.reduce([open_, close]) - rng.uniform(0, volatility)
+    volume = rng.integers(1000, 10000, size=periods, dtype=np.int32)
     
-    return pd.DataFrame(ohlc_data, index=dates)
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume
+    }, index=dates, copy=False)
+
+def resample_ohlc(df, rule):
+    """Aggregate OHLC bars to a higher timeframe"""
+    return df.resample(rule).agg({
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last',
+        'Volume': 'sum'
+    })
 
 def test_smc_components():
     """Test individual SMC components"""
@@ -170,11 +185,12 @@ def test_analyzer():
         analyzer = SMCAnalyzer(settings)
         print(f"✅ SMC Analyzer created successfully")
         
-        # Generate multi-timeframe data
+        # Generate multi-timeframe data from a single M15 series
+        df_m15 = generate_realistic_ohlc(periods=100 * 16, base_price=1.1000, freq='15min')
         symbol_data = {
-            'H4': generate_realistic_ohlc(periods=100, base_price=1.1000),
-            'H1': generate_realistic_ohlc(periods=150, base_price=1.1000),
-            'M15': generate_realistic_ohlc(periods=200, base_price=1.1000)
+            'H4': resample_ohlc(df_m15, '4h').tail(100),
+            'H1': resample_ohlc(df_m15, '1h').tail(150),
+            'M15': df_m15.tail(200)
         }
         
         current_price = symbol_data['H1'].iloc[-1]['Close']
@@ -3,6 +3,7 @@
 Simple demonstration of the enhanced SMC-Forez trading system
 Runs without external dependencies to show the improvements
 """
+import io
 import sys
 import os
 from datetime import datetime
@@ -10,16 +11,80 @@ from datetime import datetime
 # Add project to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def demonstrate_enhanced_features():
-    """Demonstrate the key enhancements made to the trading system"""
+RULE = "=" * 60
+
+SUMMARY_BLOCK = "\n".join(["", RULE, "ENHANCEMENT SUMMARY", RULE, """
+✓ UNICODE ENCODING ISSUES FIXED
+  - All logging errors resolved
+  - UTF-8 encoding properly configured
+  
+✓ QUALITY STANDARDS ENHANCED TO 70%+
+  - Minimum execution score: 70% (was 55%)
+  - Enhanced confluence requirements: 3+ factors
+  - Improved risk/reward: 2.5:1 minimum ratio
+  
+✓ SIGNAL GENERATION IMPROVED
+  - 4 specialized pattern validators
+  - 6 weighted confluence factors  
+  - Multi-grade signal classification
+  
+✓ BACKTESTING ALIGNED WITH LIVE SYSTEM
+  - Same enhanced signal logic
+  - Quality-based performance metrics
+  - Enhanced risk management
+  
+✓ COMPREHENSIVE TESTING IMPLEMENTED
+  - 70%+ standard validation
+  - Pattern and confluence testing
+  - System integrity verification
+
+The enhanced system is now ready for production use with
+significantly improved win rate potential and strict quality standards.
+"""]) + "\n"
+
+CONFLUENCE_FACTORS = [
+    {'factor': 'Trend Alignment', 'score': 3, 'weight': '30%'},
+    {'factor': 'Structure Break', 'score': 3, 'weight': '25%'},
+    {'factor': 'Order Block', 'score': 3, 'weight': '20%'},
+    {'factor': 'Liquidity Zone', 'score': 2, 'weight': '15%'},
+    {'factor': 'Fair Value Gap', 'score': 1, 'weight': '5%'},
+    {'factor': 'Supply/Demand', 'score': 1, 'weight': '5%'}
+]
+
+GRADE_THRESHOLDS = [
+    {'grade': 'INSTITUTIONAL', 'threshold': 90, 'description': 'Highest quality'},
+    {'grade': 'PROFESSIONAL', 'threshold': 75, 'description': 'High quality'},
+    {'grade': 'STANDARD', 'threshold': 70, 'description': 'Acceptable quality'},
+    {'grade': 'BELOW_STANDARD', 'threshold': 0, 'description': 'Filtered out'}
+]
+
+# Both tables are constant, so they are formatted once at import
+CONFLUENCE_TABLE = "\n".join(
+    f"  • {f['factor']}: Score {f['score']} (Weight: {f['weight']})"
+    for f in CONFLUENCE_FACTORS) + "\n"
+
+GRADE_TABLE = "\n".join(
+    f"  • {g['grade']}: "
+    f"{'<70%' if g['grade'] == 'BELOW_STANDARD' else str(g['threshold']) + '%+'}"
+    f" - {g['description']}"
+    for g in GRADE_THRESHOLDS) + "\n"
+
+
+def demonstrate_enhanced_features(out=None):
+    """
+    Demonstrate the key enhancements made to the trading system
+
+    The report is built in memory and written to `out` (stdout by default)
+    in a single call.
+    """
+    buf = io.StringIO()
+    write = buf.write
     
-    print("=" * 60)
-    print("SMC-FOREZ ENHANCED TRADING SYSTEM DEMONSTRATION")
-    print("=" * 60)
+    write(f"{RULE}\nSMC-FOREZ ENHANCED TRADING SYSTEM DEMONSTRATION\n{RULE}\n")
     
     # 1. Show Enhanced Quality Standards
-    print("\n1. ENHANCED QUALITY STANDARDS")
-    print("-" * 30)
+    write("\n1. ENHANCED QUALITY STANDARDS\n")
+    write("-" * 30 + "\n")
     
     old_standards = {
         'min_execution_score': 55.0,
@@ -35,16 +100,16 @@ def demonstrate_enhanced_features():
         'max_risk_per_trade': 1.5    # ENHANCED: Lower risk
     }
     
-    print("BEFORE vs AFTER Enhancement:")
+    write("BEFORE vs AFTER Enhancement:\n")
     for key in old_standards:
         old_val = old_standards[key]
         new_val = new_standards[key]
         improvement = "↑" if new_val > old_val else "↓"
-        print(f"  {key}: {old_val} → {new_val} {improvement}")
+        write(f"  {key}: {old_val} → {new_val} {improvement}\n")
     
     # 2. Show Signal Filtering Example
-    print("\n2. SIGNAL FILTERING DEMONSTRATION")
-    print("-" * 35)
+    write("\n2. SIGNAL FILTERING DEMONSTRATION\n")
+    write("-" * 35 + "\n")
     
     sample_signals = [
         {
@@ -70,9 +135,10 @@ def demonstrate_enhanced_features():
         }
     ]
     
-    print("Testing signals against 70%+ standard:")
+    write("Testing signals against 70%+ standard:\n")
     
     passed_signals = 0
+    lines = []
     for signal in sample_signals:
         meets_quality = signal['quality_score'] >= 0.70
         meets_confluence = signal['confluence_factors'] >= 3
@@ -82,18 +148,19 @@ def demonstrate_enhanced_features():
         passes = meets_quality and meets_confluence and meets_rr and has_patterns
         
         status = "[PASS]" if passes else "[FAIL]"
-        print(f"  {status} {signal['id']}: Quality {signal['quality_score']:.2f}, "
-              f"Confluence {signal['confluence_factors']}, RR {signal['rr_ratio']:.1f}")
+        lines.append(f"  {status} {signal['id']}: Quality {signal['quality_score']:.2f}, "
+                     f"Confluence {signal['confluence_factors']}, RR {signal['rr_ratio']:.1f}")
         
         if passes:
             passed_signals += 1
+    write("\n".join(lines) + "\n")
     
     efficiency = (passed_signals / len(sample_signals)) * 100
-    print(f"\nFiltering Results: {passed_signals}/{len(sample_signals)} signals passed (Efficiency: {efficiency:.1f}%)")
+    write(f"\nFiltering Results: {passed_signals}/{len(sample_signals)} signals passed (Efficiency: {efficiency:.1f}%)\n")
     
     # 3. Show Pattern Validation
-    print("\n3. PATTERN VALIDATION SYSTEM")
-    print("-" * 30)
+    write("\n3. PATTERN VALIDATION SYSTEM\n")
+    write("-" * 30 + "\n")
     
     pattern_types = [
         {'name': 'Breakout', 'confidence': 0.85, 'strategy': 'wait_for_retest'},
@@ -102,67 +169,48 @@ def demonstrate_enhanced_features():
         {'name': 'Trend Continuation', 'confidence': 0.75, 'strategy': 'trend_pullback'}
     ]
     
-    print("Pattern validation with confidence thresholds:")
+    write("Pattern validation with confidence thresholds:\n")
     valid_patterns = 0
     
+    lines = []
     for pattern in pattern_types:
         is_valid = pattern['confidence'] >= 0.75
         status = "[VALID]" if is_valid else "[INVALID]"
-        print(f"  {status} {pattern['name']}: {pattern['confidence']:.2f} confidence")
+        lines.append(f"  {status} {pattern['name']}: {pattern['confidence']:.2f} confidence")
         
         if is_valid:
             valid_patterns += 1
-            print(f"    → Entry Strategy: {pattern['strategy']}")
+            lines.append(f"    → Entry Strategy: {pattern['strategy']}")
+    write("\n".join(lines) + "\n")
     
-    print(f"\nPattern Results: {valid_patterns}/{len(pattern_types)} patterns validated")
+    write(f"\nPattern Results: {valid_patterns}/{len(pattern_types)} patterns validated\n")
     
     # 4. Show Confluence Scoring
-    print("\n4. ENHANCED CONFLUENCE SCORING")
-    print("-" * 32)
-    
-    confluence_factors = [
-        {'factor': 'Trend Alignment', 'score': 3, 'weight': '30%'},
-        {'factor': 'Structure Break', 'score': 3, 'weight': '25%'},
-        {'factor': 'Order Block', 'score': 3, 'weight': '20%'},
-        {'factor': 'Liquidity Zone', 'score': 2, 'weight': '15%'},
-        {'factor': 'Fair Value Gap', 'score': 1, 'weight': '5%'},
-        {'factor': 'Supply/Demand', 'score': 1, 'weight': '5%'}
-    ]
+    write("\n4. ENHANCED CONFLUENCE SCORING\n")
+    write("-" * 32 + "\n")
     
-    total_score = sum(f['score'] for f in confluence_factors)
-    avg_score = total_score / len(confluence_factors)
+    total_score = sum(f['score'] for f in CONFLUENCE_FACTORS)
+    avg_score = total_score / len(CONFLUENCE_FACTORS)
     
-    print("Weighted confluence factors:")
-    for factor in confluence_factors:
-        print(f"  • {factor['factor']}: Score {factor['score']} (Weight: {factor['weight']})")
+    write("Weighted confluence factors:\n")
+    write(CONFLUENCE_TABLE)
     
-    print(f"\nConfluence Summary:")
-    print(f"  Total Factors: {len(confluence_factors)}")
-    print(f"  Total Score: {total_score}")
-    print(f"  Average Score: {avg_score:.2f}")
-    print(f"  Meets Enhanced Standard: {len(confluence_factors) >= 3 and avg_score >= 2.0}")
+    write(f"\nConfluence Summary:\n")
+    write(f"  Total Factors: {len(CONFLUENCE_FACTORS)}\n")
+    write(f"  Total Score: {total_score}\n")
+    write(f"  Average Score: {avg_score:.2f}\n")
+    write(f"  Meets Enhanced Standard: {len(CONFLUENCE_FACTORS) >= 3 and avg_score >= 2.0}\n")
     
     # 5. Show Signal Grading
-    print("\n5. SIGNAL GRADING SYSTEM")
-    print("-" * 25)
-    
-    grade_thresholds = [
-        {'grade': 'INSTITUTIONAL', 'threshold': 90, 'description': 'Highest quality'},
-        {'grade': 'PROFESSIONAL', 'threshold': 75, 'description': 'High quality'},
-        {'grade': 'STANDARD', 'threshold': 70, 'description': 'Acceptable quality'},
-        {'grade': 'BELOW_STANDARD', 'threshold': 0, 'description': 'Filtered out'}
-    ]
+    write("\n5. SIGNAL GRADING SYSTEM\n")
+    write("-" * 25 + "\n")
     
-    print("Signal quality grades:")
-    for grade in grade_thresholds:
-        if grade['grade'] == 'BELOW_STANDARD':
-            print(f"  • {grade['grade']}: <70% - {grade['description']}")
-        else:
-            print(f"  • {grade['grade']}: {grade['threshold']}%+ - {grade['description']}")
+    write("Signal quality grades:\n")
+    write(GRADE_TABLE)
     
     # 6. Show Expected Improvements
-    print("\n6. EXPECTED IMPROVEMENTS")
-    print("-" * 25)
+    write("\n6. EXPECTED IMPROVEMENTS\n")
+    write("-" * 25 + "\n")
     
     improvements = [
         "Higher win rate due to 70%+ quality threshold",
@@ -173,43 +221,14 @@ def demonstrate_enhanced_features():
         "Improved entry timing with specialized strategies"
     ]
     
-    print("Key improvements implemented:")
-    for i, improvement in enumerate(improvements, 1):
-        print(f"  {i}. {improvement}")
+    write("Key improvements implemented:\n")
+    write("\n".join(
+        f"  {i}. {improvement}" for i, improvement in enumerate(improvements, 1)) + "\n")
     
     # 7. Summary
-    print("\n" + "=" * 60)
-    print("ENHANCEMENT SUMMARY")
-    print("=" * 60)
+    write(SUMMARY_BLOCK)
     
-    print(f"""
-✓ UNICODE ENCODING ISSUES FIXED
-  - All logging errors resolved
-  - UTF-8 encoding properly configured
-  
-✓ QUALITY STANDARDS ENHANCED TO 70%+
-  - Minimum execution score: 70% (was 55%)
-  - Enhanced confluence requirements: 3+ factors
-  - Improved risk/reward: 2.5:1 minimum ratio
-  
-✓ SIGNAL GENERATION IMPROVED
-  - 4 specialized pattern validators
-  - 6 weighted confluence factors  
-  - Multi-grade signal classification
-  
-✓ BACKTESTING ALIGNED WITH LIVE SYSTEM
-  - Same enhanced signal logic
-  - Quality-based performance metrics
-  - Enhanced risk management
-  
-✓ COMPREHENSIVE TESTING IMPLEMENTED
-  - 70%+ standard validation
-  - Pattern and confluence testing
-  - System integrity verification
-
-The enhanced system is now ready for production use with
-significantly improved win rate potential and strict quality standards.
-""")
+    (out or sys.stdout).write(buf.getvalue())
 
 def main():
     """Main demonstration function"""
@@ -222,11 +241,11 @@ def main():
 
 if __name__ == "__main__":
     success = main()
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     if success:
         print("✅ DEMONSTRATION COMPLETED SUCCESSFULLY")
         print("The enhanced SMC-Forez system is ready for use!")
     else:
         print("❌ DEMONSTRATION FAILED")
         print("Please check the error messages above.")
-    print("=" * 60)
\ No newline at end of file
+    print(RULE)
\ No newline at end of file
@@ -3,176 +3,223 @@
 SMC Forez - Quick Demo Script
 Demonstrates all the fixed issues and shows how to use the enhanced components
 """
+import contextlib
+import importlib
+import io
 import os
-import subprocess
 import sys
-from datetime import datetime
+import time
+
+
+# ASCII stand-ins used when stdout cannot encode emoji (e.g. a cp1252 console)
+EMOJI_ASCII = {
+    '🚀': '>>', '✅': '[OK]', '⚠': '[!]', '🎉': '[OK]',
+    '🎯': '*', '📋': '*', '💡': '*', '🔍': '*', '📊': '*', '⚡': '*', '📈': '*',
+    '🌟': '*', '🔬': '*', '⚙': '*', '📁': '*', '🎬': '*', '📚': '*', '⏰': '*',
+    '\ufe0f': '',
+}
+
+# Emoji are kept only on an interactive UTF-8 terminal; redirected output and
+# other encodings get the ASCII stand-ins. Decided once at import so the demo
+# does not re-check the stream per line
+EMOJI_FALLBACK = (
+    {} if sys.stdout.isatty() and (getattr(sys.stdout, 'encoding', None) or '').lower().startswith('utf')
+    else str.maketrans(EMOJI_ASCII)
+)
+
+
+def emit(*args, **kwargs):
+    """Print a demo line, swapping emoji for ASCII when EMOJI_FALLBACK is set"""
+    if EMOJI_FALLBACK:
+        args = tuple(str(arg).translate(EMOJI_FALLBACK) for arg in args)
+    print(*args, **kwargs)
+
+
+BANNER_RULE = "🚀" + "=" * 78 + "🚀"
+
+BANNER = "\n".join([
+    BANNER_RULE,
+    "🎯 SMC FOREZ - FIXES DEMONSTRATION",
+    "   All major issues have been resolved with real SMC analysis!",
+    BANNER_RULE,
+    "",
+    "",
+]).translate(EMOJI_FALLBACK)
 
 
 def print_banner():
     """Print demo banner"""
-    print("🚀" + "="*78 + "🚀")
-    print("🎯 SMC FOREZ - FIXES DEMONSTRATION")
-    print("   All major issues have been resolved with real SMC analysis!")
-    print("🚀" + "="*78 + "🚀")
-    print()
+    sys.stdout.write(BANNER)
 
 
 def demonstrate_fixes():
     """Demonstrate all the fixes"""
-    print("📋 ISSUES THAT HAVE BEEN FIXED:")
-    print("-" * 50)
-    
-    print("✅ 1. ANALYZER RELATIVE IMPORTS")
-    print("   - OLD: ImportError when running smc_forez/analyzer.py directly")
-    print("   - NEW: Can be executed directly with proper import handling")
-    print("   - TEST: python smc_forez/analyzer.py")
-    print()
-    
-    print("✅ 2. PRODUCTION RUNNER ARGUMENTS")
-    print("   - OLD: Required --mode argument not specified in user example")
-    print("   - NEW: Clear argument requirements and help text")
-    print("   - TEST: python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 7")
-    print()
-    
-    print("✅ 3. BACKTEST USING REAL SMC ANALYSIS")
-    print("   - OLD: run_backtest.py used dummy/sample signals")
-    print("   - NEW: Uses real multi-timeframe SMC analysis")
-    print("   - RESULT: Generated 48 real signals with 47.6% win rate, 1.58 profit factor")
-    print("   - TEST: python run_backtest.py (select option 1)")
-    print()
-    
-    print("✅ 4. SIGNAL RUNNER IDENTICAL SCORES")
-    print("   - OLD: All symbols had same confidence (0.70), R:R (1.80), quality (0.62)")
-    print("   - NEW: Real analysis with varying scores based on actual market conditions")
-    print("   - EXAMPLES:")
-    print("     • EURUSD: SELL @ 1.10960 (Quality: 0.56)")
-    print("     • USDJPY: BUY @ 1.05663 (Quality: 0.53)")
-    print("     • NZDUSD: BUY @ 1.11569 (Quality: 0.56)")
-    print("   - TEST: python signal_runner_enhanced.py (select option 1)")
-    print()
+    emit("📋 ISSUES THAT HAVE BEEN FIXED:")
+    emit("-" * 50)
+    
+    emit("✅ 1. ANALYZER RELATIVE IMPORTS")
+    emit("   - OLD: ImportError when running smc_forez/analyzer.py directly")
+    emit("   - NEW: Can be executed directly with proper import handling")
+    emit("   - TEST: python smc_forez/analyzer.py")
+    emit()
+    
+    emit("✅ 2. PRODUCTION RUNNER ARGUMENTS")
+    emit("   - OLD: Required --mode argument not specified in user example")
+    emit("   - NEW: Clear argument requirements and help text")
+    emit("   - TEST: python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 7")
+    emit()
+    
+    emit("✅ 3. BACKTEST USING REAL SMC ANALYSIS")
+    emit("   - OLD: run_backtest.py used dummy/sample signals")
+    emit("   - NEW: Uses real multi-timeframe SMC analysis")
+    emit("   - RESULT: Generated 48 real signals with 47.6% win rate, 1.58 profit factor")
+    emit("   - TEST: python run_backtest.py (select option 1)")
+    emit()
+    
+    emit("✅ 4. SIGNAL RUNNER IDENTICAL SCORES")
+    emit("   - OLD: All symbols had same confidence (0.70), R:R (1.80), quality (0.62)")
+    emit("   - NEW: Real analysis with varying scores based on actual market conditions")
+    emit("   - EXAMPLES:")
+    emit("     • EURUSD: SELL @ 1.10960 (Quality: 0.56)")
+    emit("     • USDJPY: BUY @ 1.05663 (Quality: 0.53)")
+    emit("     • NZDUSD: BUY @ 1.11569 (Quality: 0.56)")
+    emit("   - TEST: python signal_runner_enhanced.py (select option 1)")
+    emit()
 
 
 def show_usage_examples():
     """Show usage examples for all components"""
-    print("💡 USAGE EXAMPLES:")
-    print("-" * 50)
-    
-    print("🔍 1. DIRECT ANALYZER EXECUTION:")
-    print("   python smc_forez/analyzer.py")
-    print("   # Tests multi-timeframe analysis capabilities")
-    print()
-    
-    print("📊 2. PRODUCTION BACKTEST (Real SMC Analysis):")
-    print("   python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 30")
-    print("   # Professional backtest with real multi-timeframe analysis")
-    print()
-    
-    print("⚡ 3. ENHANCED BACKTEST RUNNER:")
-    print("   python run_backtest.py")
-    print("   # Interactive backtest with multiple configuration options")
-    print("   # Uses real SMC analysis instead of dummy signals")
-    print()
-    
-    print("🎯 4. ENHANCED SIGNAL GENERATION:")
-    print("   python signal_runner_enhanced.py")
-    print("   # Real-time signal generation using actual SMC analysis")
-    print("   # No more identical scores - each signal is unique!")
-    print()
-    
-    print("📈 5. LIVE SIGNAL MONITORING:")
-    print("   python production_runner.py --mode live --symbols EURUSD GBPUSD USDJPY")
-    print("   # Live signal monitoring (signal-only mode)")
-    print()
-    
-    print("🔍 6. SYMBOL ANALYSIS:")
-    print("   python production_runner.py --mode analyze --symbols EURUSD GBPUSD")
-    print("   # One-time multi-timeframe analysis")
-    print()
+    emit("💡 USAGE EXAMPLES:")
+    emit("-" * 50)
+    
+    emit("🔍 1. DIRECT ANALYZER EXECUTION:")
+    emit("   python smc_forez/analyzer.py")
+    emit("   # Tests multi-timeframe analysis capabilities")
+    emit()
+    
+    emit("📊 2. PRODUCTION BACKTEST (Real SMC Analysis):")
+    emit("   python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 30")
+    emit("   # Professional backtest with real multi-timeframe analysis")
+    emit()
+    
+    emit("⚡ 3. ENHANCED BACKTEST RUNNER:")
+    emit("   python run_backtest.py")
+    emit("   # Interactive backtest with multiple configuration options")
+    emit("   # Uses real SMC analysis instead of dummy signals")
+    emit()
+    
+    emit("🎯 4. ENHANCED SIGNAL GENERATION:")
+    emit("   python signal_runner_enhanced.py")
+    emit("   # Real-time signal generation using actual SMC analysis")
+    emit("   # No more identical scores - each signal is unique!")
+    emit()
+    
+    emit("📈 5. LIVE SIGNAL MONITORING:")
+    emit("   python production_runner.py --mode live --symbols EURUSD GBPUSD USDJPY")
+    emit("   # Live signal monitoring (signal-only mode)")
+    emit()
+    
+    emit("🔍 6. SYMBOL ANALYSIS:")
+    emit("   python production_runner.py --mode analyze --symbols EURUSD GBPUSD")
+    emit("   # One-time multi-timeframe analysis")
+    emit()
 
 
 def show_improvements():
     """Show the key improvements"""
-    print("🌟 KEY IMPROVEMENTS:")
-    print("-" * 50)
-    
-    print("🔬 REAL SMC ANALYSIS:")
-    print("   • Market Structure Analysis with actual swing points")
-    print("   • Fair Value Gap detection (200+ gaps found per analysis)")
-    print("   • Order Block identification (40-70 blocks per symbol)")
-    print("   • Liquidity zone mapping (1900+ zones per timeframe)")
-    print("   • Multi-timeframe confluence scoring")
-    print()
-    
-    print("📊 PERFORMANCE METRICS:")
-    print("   • Backtest: 47.6% win rate, 1.58 profit factor")
-    print("   • 48 real signals generated vs 0 dummy signals")
-    print("   • Varying quality scores (0.53-0.56) based on real analysis")
-    print("   • Risk-reward ratios calculated from actual market structure")
-    print()
-    
-    print("⚙️ TECHNICAL FIXES:")
-    print("   • Fixed relative import issues")
-    print("   • Proper command-line argument handling")
-    print("   • Mock data handling for testing without MT5")
-    print("   • JSON serialization for signal export")
-    print()
+    emit("🌟 KEY IMPROVEMENTS:")
+    emit("-" * 50)
+    
+    emit("🔬 REAL SMC ANALYSIS:")
+    emit("   • Market Structure Analysis with actual swing points")
+    emit("   • Fair Value Gap detection (200+ gaps found per analysis)")
+    emit("   • Order Block identification (40-70 blocks per symbol)")
+    emit("   • Liquidity zone mapping (1900+ zones per timeframe)")
+    emit("   • Multi-timeframe confluence scoring")
+    emit()
+    
+    emit("📊 PERFORMANCE METRICS:")
+    emit("   • Backtest: 47.6% win rate, 1.58 profit factor")
+    emit("   • 48 real signals generated vs 0 dummy signals")
+    emit("   • Varying quality scores (0.53-0.56) based on real analysis")
+    emit("   • Risk-reward ratios calculated from actual market structure")
+    emit()
+    
+    emit("⚙️ TECHNICAL FIXES:")
+    emit("   • Fixed relative import issues")
+    emit("   • Proper command-line argument handling")
+    emit("   • Mock data handling for testing without MT5")
+    emit("   • JSON serialization for signal export")
+    emit()
 
 
 def show_user_path_config():
     """Show how to adapt for user's path"""
-    print("📁 PATH CONFIGURATION:")
-    print("-" * 50)
-    print("To adapt for your local environment:")
-    print()
-    print("1. Update your command paths:")
-    print('   OLD: PS C:\\Users\\User\\Downloads\\SMC-SA Forex\\Backend>')
-    print('   NEW: Navigate to your SMC-Forez directory')
-    print()
-    print("2. Use the correct command format:")
-    print("   # Instead of just 'production_runner.py'")
-    print("   python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 30")
-    print()
-    print("3. All scripts now work from the main directory:")
-    print("   python run_backtest.py")
-    print("   python signal_runner_enhanced.py") 
-    print("   python smc_forez/analyzer.py")
-    print("   python production_runner.py --mode analyze --symbols EURUSD")
-    print()
+    emit("📁 PATH CONFIGURATION:")
+    emit("-" * 50)
+    emit("To adapt for your local environment:")
+    emit()
+    emit("1. Update your command paths:")
+    emit('   OLD: PS C:\\Users\\User\\Downloads\\SMC-SA Forex\\Backend>')
+    emit('   NEW: Navigate to your SMC-Forez directory')
+    emit()
+    emit("2. Use the correct command format:")
+    emit("   # Instead of just 'production_runner.py'")
+    emit("   python production_runner.py --mode backtest --symbol EURUSD --timeframe H1 --days 30")
+    emit()
+    emit("3. All scripts now work from the main directory:")
+    emit("   python run_backtest.py")
+    emit("   python signal_runner_enhanced.py") 
+    emit("   python smc_forez/analyzer.py")
+    emit("   python production_runner.py --mode analyze --symbols EURUSD")
+    emit()
 
 
-def run_quick_demo():
-    """Run a quick demonstration"""
-    print("🎬 QUICK DEMONSTRATION:")
-    print("-" * 50)
+def _probe(func):
+    """
+    Run func in this process with its output captured
     
-    print("Testing analyzer direct execution...")
+    Returns (output, problem), where problem describes an exception or a
+    non-zero SystemExit (what a failed run of the script would have shown).
+    """
+    output = io.StringIO()
     try:
-        result = subprocess.run([sys.executable, "smc_forez/analyzer.py"], 
-                              capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            print("✅ Analyzer runs successfully!")
-            lines = result.stdout.split('\n')
-            print(f"   Sample output: {lines[1] if len(lines) > 1 else 'Output captured'}")
-        else:
-            print("⚠️  Analyzer had issues, but this is expected without full dependencies")
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            func()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return output.getvalue(), f"exited with status {e.code}"
     except Exception as e:
-        print(f"⚠️  Demo skipped: {str(e)}")
+        return output.getvalue(), f"{type(e).__name__}: {e}"
+    return output.getvalue(), None
+
+
+def run_quick_demo():
+    """Run a quick demonstration"""
+    emit("🎬 QUICK DEMONSTRATION:")
+    emit("-" * 50)
     
-    print()
-    print("Testing production runner help...")
-    try:
-        result = subprocess.run([sys.executable, "production_runner.py", "--help"], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print("✅ Production runner help works!")
-            print("   Arguments properly configured")
-        else:
-            print("⚠️  Production runner had issues")
-    except Exception as e:
-        print(f"⚠️  Demo skipped: {str(e)}")
+    emit("Testing analyzer direct execution...")
+    output, problem = _probe(lambda: importlib.import_module('smc_forez.analyzer').main())
+    if problem is None:
+        emit("✅ Analyzer runs successfully!")
+        lines = output.split('\n')
+        emit(f"   Sample output: {lines[1] if len(lines) > 1 else 'Output captured'}")
+    else:
+        emit("⚠️  Analyzer had issues, but this is expected without full dependencies")
+        emit(f"   Issue: {problem}")
+    
+    emit()
+    emit("Testing production runner help...")
+    _, problem = _probe(lambda: importlib.import_module('production_runner').build_parser().format_help())
+    if problem is None:
+        emit("✅ Production runner help works!")
+        emit("   Arguments properly configured")
+    else:
+        emit("⚠️  Production runner had issues")
+        emit(f"   Issue: {problem}")
     
-    print()
+    emit()
 
 
 def main():
@@ -183,28 +230,28 @@ def main():
     show_usage_examples()
     show_user_path_config()
     
-    print()
+    emit()
     response = input("Run quick demonstration? (y/n): ").strip().lower()
     if response in ['y', 'yes']:
         run_quick_demo()
     
-    print()
-    print("🎉 ALL ISSUES HAVE BEEN SUCCESSFULLY RESOLVED!")
-    print()
-    print("🚀 SUMMARY:")
-    print("   ✅ Real SMC multi-timeframe analysis integrated")
-    print("   ✅ No more dummy data or identical signals") 
-    print("   ✅ All import and execution issues fixed")
-    print("   ✅ Professional backtesting with real performance metrics")
-    print("   ✅ Quality signal generation with varying scores")
-    print()
-    print("📚 Next Steps:")
-    print("   1. Install dependencies: pip install -r requirements.txt")
-    print("   2. Configure MT5 for live data (optional)")
-    print("   3. Run the enhanced components as shown above")
-    print("   4. Check the generated JSON files for detailed results")
-    print()
-    print(f"⏰ Demonstration completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    emit()
+    emit("🎉 ALL ISSUES HAVE BEEN SUCCESSFULLY RESOLVED!")
+    emit()
+    emit("🚀 SUMMARY:")
+    emit("   ✅ Real SMC multi-timeframe analysis integrated")
+    emit("   ✅ No more dummy data or identical signals") 
+    emit("   ✅ All import and execution issues fixed")
+    emit("   ✅ Professional backtesting with real performance metrics")
+    emit("   ✅ Quality signal generation with varying scores")
+    emit()
+    emit("📚 Next Steps:")
+    emit("   1. Install dependencies: pip install -r requirements.txt")
+    emit("   2. Configure MT5 for live data (optional)")
+    emit("   3. Run the enhanced components as shown above")
+    emit("   4. Check the generated JSON files for detailed results")
+    emit()
+    emit(f"⏰ Demonstration completed at {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
 
 if __name__ == "__main__":
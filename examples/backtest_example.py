@@ -2,17 +2,33 @@
 Example backtesting script for the SMC Forez analyzer
 """
 import logging
-import pandas as pd
-import numpy as np
+import os
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from datetime import datetime, timedelta
-from smc_forez import SMCAnalyzer, Settings
-from smc_forez.config.settings import Timeframe
+
+# pandas, numpy and the analyzer package are imported inside the functions
+# that use them, so loading this script does not pull in the analyzer graph
+if TYPE_CHECKING:
+    import pandas as pd
+    from smc_forez import Settings
+    from smc_forez.config.settings import Timeframe
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_sample_data(symbol: str, days: int = 365) -> pd.DataFrame:
+# Columns of the per symbol/timeframe summary rows
+SUMMARY_COLUMNS = ('symbol', 'timeframe', 'final_balance', 'total_return',
+                   'win_rate', 'total_trades', 'profit_factor', 'max_drawdown')
+
+def _symbol_seed(symbol: str) -> int:
+    """Stable RNG seed for a symbol (``hash()`` is salted per process)"""
+    return zlib.crc32(symbol.encode())
+
+def create_sample_data(symbol: str, days: int = 365) -> 'pd.DataFrame':
     """
     Create sample OHLC data for testing when MT5 is not available
     
@@ -23,8 +39,12 @@ def create_sample_data(symbol: str, days: int = 365) -> pd.DataFrame:
     Returns:
         DataFrame with sample OHLC data
     """
-    # Generate sample data with realistic forex movements
-    np.random.seed(42)  # For reproducible results
+    import numpy as np
+    import pandas as pd
+    
+    # Generate sample data with realistic forex movements from a generator
+    # keyed on the symbol, so results are reproducible in any worker process
+    rng = np.random.default_rng(np.random.SeedSequence(_symbol_seed(symbol)))
     
     dates = pd.date_range(start=datetime.now() - timedelta(days=days), 
                          end=datetime.now(), freq='H')
@@ -39,51 +59,159 @@ def create_sample_data(symbol: str, days: int = 365) -> pd.DataFrame:
     else:
         start_price = 1.0000
     
-    # Generate price movements
-    returns = np.random.normal(0, 0.0005, len(dates))  # Small random movements
+    # Draw the return and volatility noise together, one column each
+    noise = rng.standard_normal((len(dates), 2))
+    returns = noise[:, 0] * 0.0005  # Small random movements
     
     # Add some trend and volatility
     trend = np.sin(np.arange(len(dates)) * 0.01) * 0.0002
     volatility = np.abs(np.sin(np.arange(len(dates)) * 0.1)) * 0.0003
     
-    price_changes = returns + trend + np.random.normal(0, volatility)
+    price_changes = returns + trend + noise[:, 1] * volatility
     prices = start_price * np.exp(np.cumsum(price_changes))
     
-    # Create OHLC data
-    data = []
-    for i, price in enumerate(prices):
-        # Create realistic OHLC based on close price
-        spread = price * 0.0001  # 1 pip spread
-        
-        high = price + np.random.uniform(0, spread * 5)
-        low = price - np.random.uniform(0, spread * 5)
-        open_price = prices[i-1] if i > 0 else price
-        
-        data.append({
-            'Open': open_price,
-            'High': max(open_price, price, high),
-            'Low': min(open_price, price, low),
-            'Close': price,
-            'Volume': np.random.randint(100, 1000)
-        })
-    
-    df = pd.DataFrame(data, index=dates)
+    # Create OHLC data from the close series in whole-array operations
+    n = len(prices)
+    spread = prices * 0.0001  # 1 pip spread
+    
+    high = prices + rng.uniform(0, spread * 5, n)
+    low = prices - rng.uniform(0, spread * 5, n)
+    
+    # Each bar opens at the previous close
+    open_price = np.empty(n)
+    open_price[0] = prices[0]
+    open_price[1:] = prices[:-1]
+    
+    df = pd.DataFrame({
+        'Open': open_price,
+        'High': np.maximum.reduce([open_price, prices, high]),
+        'Low': np.minimum.reduce([open_price, prices, low]),
+        'Close': prices,
+        'Volume': rng.integers(100, 1000, n)
+    }, index=dates)
     return df
 
+def create_settings() -> 'Settings':
+    """Settings shared by every backtest in the example"""
+    from smc_forez import Settings
+    
+    settings = Settings()
+    settings.backtest.initial_balance = 10000
+    settings.trading.risk_per_trade = 0.01  # 1% risk
+    settings.trading.min_rr_ratio = 1.5
+    return settings
+
+def backtest_symbol_timeframe(symbol: str, timeframe: 'Timeframe') -> Tuple[List[str], Optional[Tuple]]:
+    """
+    Scan one symbol/timeframe for signals and backtest them
+    
+    Runs in a worker process, so it builds its own analyzer and returns its
+    report lines instead of printing them.
+    
+    Args:
+        symbol: Currency pair symbol
+        timeframe: Timeframe being tested
+        
+    Returns:
+        Tuple of (report lines, summary row in SUMMARY_COLUMNS order or None
+        if no backtest ran)
+    """
+    from smc_forez import SMCAnalyzer
+    
+    out = [f"  Timeframe: {timeframe.value}"]
+    
+    try:
+        analyzer = SMCAnalyzer(create_settings())
+        
+        # For demo purposes, create sample data
+        # In production, this would use real MT5 data
+        sample_data = create_sample_data(symbol, days=180)  # 6 months
+        
+        # Simulate the backtest workflow
+        out.append(f"    Generated {len(sample_data)} data points")
+        
+        # Analyze the data to get signals
+        signals = []
+        window_size = 200
+        
+        # Swing points only depend on nearby bars, so find them once
+        # and slice them per window instead of rescanning each window
+        swing_points = analyzer.structure_analyzer.find_swing_points(sample_data)
+        
+        # Bar times as int64 epoch-ns; the backtest engine matches
+        # signals on these directly
+        bar_times = sample_data.index.asi8
+        closes = sample_data['Close'].to_numpy()
+        
+        for i in range(window_size, len(sample_data), 50):  # Check every 50 bars
+            window_data = sample_data.iloc[i-window_size:i+1]
+            window_swings = analyzer.structure_analyzer.window_swing_points(
+                swing_points, i - window_size, i + 1
+            )
+            
+            # Perform analysis
+            market_structure = analyzer.structure_analyzer.get_market_structure_levels(
+                window_data, window_swings
+            )
+            smc_analysis = analyzer.smc_analyzer.get_smart_money_analysis(window_data)
+            
+            # Generate signal
+            current_price = closes[i]
+            signal = analyzer.signal_generator.generate_signal(
+                market_structure, smc_analysis, current_price
+            )
+            
+            # Add timestamp and save valid signals
+            if signal.get('valid', False):
+                signal['timestamp'] = bar_times[i]
+                signals.append(signal)
+        
+        out.append(f"    Generated {len(signals)} valid signals")
+        
+        if not signals:
+            out.append("    No valid signals generated")
+            return out, None
+        
+        # Run backtest
+        results = analyzer.backtest_engine.run_backtest(sample_data, signals)
+        
+        if 'error' in results:
+            out.append(f"    Error: {results['error']}")
+            return out, None
+        
+        metrics = results['performance_metrics']
+        
+        out.append(f"    Final Balance: ${results['final_balance']:,.2f}")
+        out.append(f"    Total Return: {results['total_return']:.2f}%")
+        out.append(f"    Win Rate: {metrics.win_rate * 100:.1f}%")
+        out.append(f"    Profit Factor: {metrics.profit_factor:.2f}")
+        out.append(f"    Max Drawdown: {metrics.max_drawdown_pct:.2f}%")
+        
+        return out, (
+            symbol,
+            timeframe.value,
+            results['final_balance'],
+            results['total_return'],
+            metrics.win_rate * 100,
+            metrics.total_trades,
+            metrics.profit_factor,
+            metrics.max_drawdown_pct
+        )
+        
+    except Exception as e:
+        out.append(f"    Error: {str(e)}")
+        return out, None
+
 def run_backtest_example():
     """Run a comprehensive backtesting example"""
+    import pandas as pd
+    from smc_forez.config.settings import Timeframe
     
     print("SMC Forez - Backtesting Example")
     print("=" * 40)
     
     # Create settings
-    settings = Settings()
-    settings.backtest.initial_balance = 10000
-    settings.trading.risk_per_trade = 0.01  # 1% risk
-    settings.trading.min_rr_ratio = 1.5
-    
-    # Initialize analyzer
-    analyzer = SMCAnalyzer(settings)
+    settings = create_settings()
     
     # Test symbols
     symbols = ["EURUSD", "GBPUSD"]
@@ -93,76 +221,22 @@ def run_backtest_example():
     print(f"Initial Balance: ${settings.backtest.initial_balance:,.2f}")
     print(f"Risk per Trade: {settings.trading.risk_per_trade * 100}%")
     
-    results_summary = []
+    # Each symbol/timeframe backtest is independent and CPU-bound, so run
+    # them in separate processes and report in the original order
+    jobs = [(symbol, timeframe) for symbol in symbols for timeframe in timeframes]
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        outcomes = list(executor.map(backtest_symbol_timeframe, *zip(*jobs)))
     
-    for symbol in symbols:
-        print(f"\nBacktesting {symbol}...")
-        
-        for timeframe in timeframes:
-            print(f"  Timeframe: {timeframe.value}")
-            
-            try:
-                # For demo purposes, create sample data
-                # In production, this would use real MT5 data
-                sample_data = create_sample_data(symbol, days=180)  # 6 months
-                
-                # Simulate the backtest workflow
-                print(f"    Generated {len(sample_data)} data points")
-                
-                # Analyze the data to get signals
-                signals = []
-                window_size = 200
-                
-                for i in range(window_size, len(sample_data), 50):  # Check every 50 bars
-                    window_data = sample_data.iloc[i-window_size:i+1]
-                    
-                    # Perform analysis
-                    market_structure = analyzer.structure_analyzer.get_market_structure_levels(window_data)
-                    smc_analysis = analyzer.smc_analyzer.get_smart_money_analysis(window_data)
-                    
-                    # Generate signal
-                    current_price = window_data['Close'].iloc[-1]
-                    signal = analyzer.signal_generator.generate_signal(
-                        market_structure, smc_analysis, current_price
-                    )
-                    
-                    # Add timestamp and save valid signals
-                    if signal.get('valid', False):
-                        signal['timestamp'] = sample_data.index[i]
-                        signals.append(signal)
-                
-                print(f"    Generated {len(signals)} valid signals")
-                
-                if signals:
-                    # Run backtest
-                    results = analyzer.backtest_engine.run_backtest(sample_data, signals)
-                    
-                    if 'error' not in results:
-                        metrics = results['performance_metrics']
-                        
-                        print(f"    Final Balance: ${results['final_balance']:,.2f}")
-                        print(f"    Total Return: {results['total_return']:.2f}%")
-                        print(f"    Win Rate: {metrics.win_rate * 100:.1f}%")
-                        print(f"    Profit Factor: {metrics.profit_factor:.2f}")
-                        print(f"    Max Drawdown: {metrics.max_drawdown_pct:.2f}%")
-                        
-                        results_summary.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe.value,
-                            'final_balance': results['final_balance'],
-                            'total_return': results['total_return'],
-                            'win_rate': metrics.win_rate * 100,
-                            'total_trades': metrics.total_trades,
-                            'profit_factor': metrics.profit_factor,
-                            'max_drawdown': metrics.max_drawdown_pct
-                        })
-                    else:
-                        print(f"    Error: {results['error']}")
-                else:
-                    print("    No valid signals generated")
-                    
-            except Exception as e:
-                print(f"    Error: {str(e)}")
+    # Summary rows are collected column-wise for the DataFrame
+    results_summary = defaultdict(list)
+    
+    for (symbol, timeframe), (lines, summary) in zip(jobs, outcomes):
+        if timeframe == timeframes[0]:
+            print(f"\nBacktesting {symbol}...")
+        print("\n".join(lines))
+        if summary is not None:
+            for column, value in zip(SUMMARY_COLUMNS, summary):
+                results_summary[column].append(value)
     
     # Summary
     if results_summary:
@@ -31,13 +31,16 @@ def simple_backtest_example():
     # Generate sample price data
     np.random.seed(42)
     base_price = 1.1000
-    price_changes = np.cumsum(np.random.normal(0, 0.0001, len(dates)))
+    # Build the price path in a single buffer: draw, accumulate, offset
+    prices = np.random.normal(0, 0.0001, len(dates))
+    np.cumsum(prices, out=prices)
+    np.add(prices, base_price, out=prices)
     
     data = pd.DataFrame({
-        'Open': base_price + price_changes,
-        'High': base_price + price_changes + np.random.uniform(0.0001, 0.0005, len(dates)),
-        'Low': base_price + price_changes - np.random.uniform(0.0001, 0.0005, len(dates)),
-        'Close': base_price + price_changes + np.random.normal(0, 0.0001, len(dates)),
+        'Open': prices,
+        'High': prices + np.random.uniform(0.0001, 0.0005, len(dates)),
+        'Low': prices - np.random.uniform(0.0001, 0.0005, len(dates)),
+        'Close': prices + np.random.normal(0, 0.0001, len(dates)),
     }, index=dates)
     
     print(f"   Created {len(data)} bars of data")
@@ -117,9 +120,11 @@ def advanced_example():
     np.random.seed(123)
     
     # Simulate trending market
-    trend = np.linspace(0, 0.02, len(dates))  # 2% uptrend over period
-    noise = np.cumsum(np.random.normal(0, 0.0002, len(dates)))
-    prices = 1.1000 + trend + noise
+    prices = np.linspace(0, 0.02, len(dates))  # 2% uptrend over period
+    np.add(prices, 1.1000, out=prices)
+    noise = np.random.normal(0, 0.0002, len(dates))
+    np.cumsum(noise, out=noise)
+    np.add(prices, noise, out=prices)
     
     data = pd.DataFrame({
         'Open': prices,
@@ -128,33 +133,27 @@ def advanced_example():
         'Close': prices + np.random.normal(0, 0.0001, len(dates)),
     }, index=dates)
     
-    # Create multiple signals with varying R:R ratios
-    signals = []
-    for i in range(0, len(dates), 50):
-        if i + 5 < len(dates):
-            timestamp = dates[i + 5]
-            current_price = data.loc[timestamp, 'Close']
-            
-            # Alternate signal types
-            signal_type = SignalType.BUY if i % 100 == 0 else SignalType.SELL
-            
-            if signal_type == SignalType.BUY:
-                entry = current_price
-                stop_loss = current_price * 0.998  # 0.2% stop
-                take_profit = current_price * 1.006  # 0.6% target (3:1 R:R)
-            else:
-                entry = current_price
-                stop_loss = current_price * 1.002  # 0.2% stop
-                take_profit = current_price * 0.994  # 0.6% target (3:1 R:R)
-            
-            signals.append({
-                'timestamp': timestamp,
-                'signal_type': signal_type,
-                'valid': True,
-                'entry_price': entry,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit
-            })
+    # Create multiple signals with varying R:R ratios, one every 50 bars
+    idx = np.arange(5, len(dates), 50)
+    entry = data['Close'].to_numpy()[idx]
+    
+    # Alternate signal types
+    is_buy = (idx // 50) % 2 == 0
+    stop_loss = np.where(is_buy, entry * 0.998, entry * 1.002)  # 0.2% stop
+    take_profit = np.where(is_buy, entry * 1.006, entry * 0.994)  # 0.6% target (3:1 R:R)
+    
+    signals = [
+        {
+            'timestamp': timestamp,
+            'signal_type': SignalType.BUY if buy else SignalType.SELL,
+            'valid': True,
+            'entry_price': entry_price,
+            'stop_loss': sl,
+            'take_profit': tp
+        }
+        for timestamp, buy, entry_price, sl, tp
+        in zip(dates[idx], is_buy, entry, stop_loss, take_profit)
+    ]
     
     print(f"Running backtest with {len(signals)} signals on {len(data)} bars...")
     
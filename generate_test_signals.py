@@ -4,7 +4,6 @@ Simple test script to generate sample signals for testing the executor
 """
 import sys
 import os
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +13,7 @@ sys.path.insert(0, project_root)
 
 from smc_forez.signals.signal_generator import SignalType
 from smc_forez.config.settings import Settings
+from smc_forez.utils.json_io import dump_json
 
 def generate_test_signals():
     """Generate sample test signals"""
@@ -66,6 +66,9 @@ def generate_test_signals():
         }
     ]
     
+    # One timestamp for the whole batch
+    generated_at = datetime.now().isoformat()
+    
     for signal_data in signals_data:
         # Calculate risk/reward ratio
         entry = signal_data['entry_price']
@@ -77,7 +80,7 @@ def generate_test_signals():
         rr_ratio = reward / risk if risk > 0 else 0
         
         signal = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': generated_at,
             'symbol': signal_data['symbol'],
             'signal_type': signal_data['signal_type'],
             'entry_price': signal_data['entry_price'],
@@ -117,8 +120,7 @@ def save_test_signals(signals):
         'signals': signals
     }
     
-    with open(filepath, 'w') as f:
-        json.dump(signal_data, f, indent=2, default=str)
+    dump_json(signal_data, filepath)
     
     print(f"✓ Test signals saved to: {filepath}")
     return str(filepath)
@@ -5,13 +5,19 @@ Supports multiple symbols with 30+ days of historical data and comprehensive res
 """
 import sys
 import os
+import zlib
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-import json
-from typing import Dict, List, Optional
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 # Add project to path
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -20,12 +26,119 @@ sys.path.insert(0, project_root)
 from smc_forez.backtesting import BacktestEngine, Trade, PerformanceMetrics
 from smc_forez.signals.signal_generator import SignalType
 from smc_forez.config.settings import Settings, Timeframe
+from smc_forez.utils.json_io import dump_json
+
+# Try to import numba - graceful fallback to a plain Python loop if not available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+@dataclass(frozen=True)
+class QuoteProfile:
+    """Price conventions shared by a group of currency pairs"""
+    low_bound: float
+    high_bound: float
+    decimals: int
+    stop_range: Tuple[float, float]  # 20-50 pips
+    target_range: Tuple[float, float]  # 40-100 pips
+
+
+JPY_QUOTES = QuoteProfile(50.0, 200.0, 3, (0.2, 0.5), (0.4, 1.0))
+STANDARD_QUOTES = QuoteProfile(0.3000, 2.0000, 5, (0.0020, 0.0050), (0.0040, 0.0100))
+
+
+def _quote_profile(symbol: str) -> QuoteProfile:
+    """Quote conventions for a symbol (JPY pairs are priced 100x larger)"""
+    return JPY_QUOTES if "JPY" in symbol else STANDARD_QUOTES
+
+
+# Starting price of each symbol's synthetic series (read-only)
+BASE_PRICES = MappingProxyType({
+    "EURUSD": 1.1000, "GBPUSD": 1.2500, "USDJPY": 110.00, "USDCHF": 0.9200,
+    "AUDUSD": 0.7500, "USDCAD": 1.2500, "NZDUSD": 0.6800, "EURJPY": 121.00,
+    "EURGBP": 0.8800, "EURCHF": 1.0100, "EURAUD": 1.4700, "EURCAD": 1.3800,
+    "EURNZD": 1.6200, "GBPJPY": 137.50, "GBPCHF": 1.1500, "GBPAUD": 1.6700,
+    "GBPCAD": 1.5600, "GBPNZD": 1.8400, "AUDJPY": 82.50, "AUDCHF": 0.6900,
+    "AUDCAD": 0.9400, "AUDNZD": 1.0700, "NZDJPY": 77.00, "NZDCHF": 0.6400,
+    "NZDCAD": 0.8700, "CADJPY": 87.50, "CADCHF": 0.7400, "CHFJPY": 118.50
+})
+
+# Bars per day and pandas frequency of each supported timeframe
+TIMEFRAME_BARS = {
+    "H1": (24, 'h'),
+    "H4": (6, '4h'),
+    "D1": (1, 'D'),
+    "M15": (96, '15min'),
+}
+
+# Independent random streams drawn from each symbol's seed
+DATA_STREAM = 0
+SIGNAL_STREAM = 1
+
+# Columns of the generated (and cached) historical data
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Version of the bar generator in cache keys; bump it whenever
+# create_historical_data draws different bars for the same inputs
+DATA_CACHE_VERSION = 2
+
+# Try to import pyarrow - signal tables fall back to CSV if not available
+try:
+    import pyarrow  # Parquet engine used by pandas
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _clamped_walk(base_price, price_changes, low_bound, high_bound):
+    """Price path from base_price, clamping every step to [low_bound, high_bound]"""
+    prices = np.empty_like(price_changes)
+    prices[0] = base_price
+    for i in range(1, price_changes.size):
+        price = prices[i - 1] + price_changes[i]
+        if price < low_bound:
+            price = low_bound
+        elif price > high_bound:
+            price = high_bound
+        prices[i] = price
+    return prices
+
+
+if NUMBA_AVAILABLE:
+    _clamped_walk = njit(cache=True)(_clamped_walk)
+
+
+def _object_to_json(obj):
+    """Fallback conversion: an object's attributes (trades, metrics), else its string"""
+    return obj.__dict__ if hasattr(obj, '__dict__') else str(obj)
+
+
+# JSON conversions for values the writer cannot serialize, keyed by type;
+# subclasses resolve to their nearest listed base
+JSON_CONVERTERS: Dict[type, Callable] = {
+    pd.Timestamp: pd.Timestamp.isoformat,
+    datetime: datetime.isoformat,
+    timedelta: str,
+    Enum: lambda obj: obj.value,
+    np.generic: np.generic.item,
+}
+
+
+@lru_cache(maxsize=None)
+def _json_converter(cls: type) -> Callable:
+    """Converter for a type, resolved once through its MRO"""
+    for base in cls.__mro__:
+        if base in JSON_CONVERTERS:
+            return JSON_CONVERTERS[base]
+    return _object_to_json
+
+
 class MultiSymbolBacktester:
     """Enhanced backtester that handles multiple symbols with comprehensive reporting"""
     
@@ -34,7 +147,22 @@ class MultiSymbolBacktester:
         self.results_dir = Path("backtest_results")
         self.results_dir.mkdir(exist_ok=True)
         
-    def create_historical_data(self, symbol: str, days: int = 30, timeframe: str = "H1") -> pd.DataFrame:
+    def _symbol_seed(self, symbol: str) -> int:
+        """
+        Random seed for a symbol, so each symbol gets its own series
+        
+        A CRC32 of the symbol rather than hash(), which is salted per process
+        and would make runs and worker processes disagree.
+        """
+        return zlib.crc32(symbol.encode('ascii'))
+        
+    def _symbol_rng(self, symbol: str, stream: int = DATA_STREAM) -> np.random.Generator:
+        """Random generator for one of a symbol's independent streams (data or signals)"""
+        return np.random.default_rng([self._symbol_seed(symbol), stream])
+        
+    def create_historical_data(self, symbol: str, days: int = 30, timeframe: str = "H1",
+                               rng: Optional[np.random.Generator] = None,
+                               use_cache: bool = False) -> pd.DataFrame:
         """
         Create realistic historical data for backtesting
         
@@ -42,111 +170,102 @@ class MultiSymbolBacktester:
             symbol: Currency pair symbol
             days: Number of days of historical data
             timeframe: Timeframe for data generation
+            rng: Random generator to draw from (seeded from the symbol if omitted)
+            use_cache: Reuse bars saved under results_dir/_cache by an earlier run
+                (only applies to symbol-seeded data, i.e. when rng is omitted)
             
         Returns:
             DataFrame with OHLC data
         """
-        logger.info(f"Creating {days} days of {timeframe} data for {symbol}")
-        
-        # Calculate number of bars based on timeframe
-        if timeframe == "H1":
-            bars_per_day = 24
-        elif timeframe == "H4":
-            bars_per_day = 6
-        elif timeframe == "D1":
-            bars_per_day = 1
-        elif timeframe == "M15":
-            bars_per_day = 96
-        else:
-            bars_per_day = 24  # Default to H1
-            
+        logger.info("Creating %d days of %s data for %s", days, timeframe, symbol)
+        
+        # Calculate number of bars based on timeframe (default to H1)
+        bars_per_day, freq = TIMEFRAME_BARS.get(timeframe, TIMEFRAME_BARS["H1"])
         num_bars = days * bars_per_day
         
         # Create date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        if timeframe == "H1":
-            dates = pd.date_range(start=start_date, end=end_date, freq='h')[:num_bars]
-        elif timeframe == "H4":
-            dates = pd.date_range(start=start_date, end=end_date, freq='4h')[:num_bars]
-        elif timeframe == "D1":
-            dates = pd.date_range(start=start_date, end=end_date, freq='D')[:num_bars]
-        elif timeframe == "M15":
-            dates = pd.date_range(start=start_date, end=end_date, freq='15min')[:num_bars]
-        else:
-            dates = pd.date_range(start=start_date, end=end_date, freq='h')[:num_bars]
+        start_date = datetime.now() - timedelta(days=days)
+        dates = pd.date_range(start=start_date, periods=num_bars, freq=freq)
+        
+        # Symbol-seeded bars only depend on the inputs below, so they can be
+        # reused across runs; the dates are always rebuilt relative to now
+        cache_path = None
+        if use_cache and rng is None:
+            cache_key = f"v{DATA_CACHE_VERSION}_{symbol}_{days}_{timeframe}_{self._symbol_seed(symbol)}"
+            cache_path = self.results_dir / "_cache" / f"{cache_key}.npz"
+            if cache_path.exists():
+                with np.load(cache_path) as cached:
+                    df = pd.DataFrame({column: cached[column] for column in OHLCV_COLUMNS}, index=dates)
+                logger.info("✓ Loaded %d cached bars of historical data for %s", len(df), symbol)
+                return df
         
         # Set base price for different symbols
-        base_prices = {
-            "EURUSD": 1.1000, "GBPUSD": 1.2500, "USDJPY": 110.00, "USDCHF": 0.9200,
-            "AUDUSD": 0.7500, "USDCAD": 1.2500, "NZDUSD": 0.6800, "EURJPY": 121.00,
-            "EURGBP": 0.8800, "EURCHF": 1.0100, "EURAUD": 1.4700, "EURCAD": 1.3800,
-            "EURNZD": 1.6200, "GBPJPY": 137.50, "GBPCHF": 1.1500, "GBPAUD": 1.6700,
-            "GBPCAD": 1.5600, "GBPNZD": 1.8400, "AUDJPY": 82.50, "AUDCHF": 0.6900,
-            "AUDCAD": 0.9400, "AUDNZD": 1.0700, "NZDJPY": 77.00, "NZDCHF": 0.6400,
-            "NZDCAD": 0.8700, "CADJPY": 87.50, "CADCHF": 0.7400, "CHFJPY": 118.50
-        }
-        
-        base_price = base_prices.get(symbol, 1.1000)
+        base_price = BASE_PRICES.get(symbol, 1.1000)
+        quotes = _quote_profile(symbol)
         
         # Generate realistic price movements
-        np.random.seed(hash(symbol) % 2**32)  # Different seed for each symbol
+        if rng is None:
+            rng = self._symbol_rng(symbol)
         
         # Create price changes with trending and ranging behavior
-        price_changes = np.random.normal(0, 0.0003, len(dates))  # Base volatility
+        price_changes = rng.normal(0, 0.0003, len(dates))  # Base volatility
         
         # Add trending behavior (some symbols trend more than others)
-        trend_strength = np.random.uniform(-0.002, 0.002)
+        trend_strength = rng.uniform(-0.002, 0.002)
         trend = np.linspace(-trend_strength, trend_strength, len(dates))
         price_changes += trend
         
         # Add some volatility clustering
-        volatility = np.random.uniform(0.8, 1.2, len(dates))
+        volatility = rng.uniform(0.8, 1.2, len(dates))
         price_changes *= volatility
         
-        # Calculate prices
-        prices = [base_price]
-        for change in price_changes[1:]:
-            new_price = prices[-1] + change
-            # Keep within realistic bounds for each symbol
-            if "JPY" in symbol:
-                new_price = max(50.0, min(200.0, new_price))
-            else:
-                new_price = max(0.3000, min(2.0000, new_price))
-            prices.append(new_price)
-        
-        # Create OHLC data
-        data = []
-        for i, price in enumerate(prices):
-            # Create realistic OHLC bars
-            spread = np.random.uniform(0.0001, 0.0005)  # Variable spread
-            
-            open_price = price + np.random.uniform(-spread, spread)
-            close_price = price + np.random.uniform(-spread, spread)
-            
-            high_price = max(open_price, close_price) + np.random.uniform(0, spread * 2)
-            low_price = min(open_price, close_price) - np.random.uniform(0, spread * 2)
-            
-            # Round to appropriate decimal places
-            if "JPY" in symbol:
-                decimals = 3
-            else:
-                decimals = 5
-                
-            data.append({
-                'Open': round(open_price, decimals),
-                'High': round(high_price, decimals), 
-                'Low': round(low_price, decimals),
-                'Close': round(close_price, decimals),
-                'Volume': np.random.randint(100, 1000)
-            })
-        
-        df = pd.DataFrame(data, index=dates)
-        logger.info(f"✓ Created {len(df)} bars of historical data for {symbol}")
+        # Calculate prices as a running sum of the changes from the base price
+        steps = price_changes.copy()
+        steps[0] = base_price
+        prices = np.cumsum(steps)
+        
+        # Keep within realistic bounds for each symbol; the clamp feeds into
+        # later steps, so a path that leaves the bounds is replayed step by step
+        if prices[1:].min() < quotes.low_bound or prices[1:].max() > quotes.high_bound:
+            prices = _clamped_walk(base_price, price_changes, quotes.low_bound, quotes.high_bound)
+        
+        # Create realistic OHLC bars, one column at a time
+        n = len(prices)
+        spread = rng.uniform(0.0001, 0.0005, n)  # Variable spread
+        
+        open_price = prices + rng.uniform(-spread, spread)
+        close_price = prices + rng.uniform(-spread, spread)
+        
+        high_price = np.maximum(open_price, close_price) + rng.uniform(0, spread * 2)
+        low_price = np.minimum(open_price, close_price) - rng.uniform(0, spread * 2)
+        
+        # Round to appropriate decimal places in one pass over all four columns;
+        # prices stay float64 (float32 cannot hold JPY quotes to 3 decimals) and
+        # only Volume is narrowed to int32
+        ohlc = np.stack([open_price, high_price, low_price, close_price])
+        np.round(ohlc, quotes.decimals, out=ohlc)
+        df = pd.DataFrame({
+            'Open': ohlc[0],
+            'High': ohlc[1],
+            'Low': ohlc[2],
+            'Close': ohlc[3],
+            'Volume': rng.integers(100, 1000, n, dtype=np.int32)
+        }, index=dates, copy=False)
+        
+        if cache_path is not None:
+            # Write to a temporary file and rename it into place, so an
+            # interrupted write never leaves a truncated cache entry behind
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **{column: df[column].to_numpy() for column in OHLCV_COLUMNS})
+            os.replace(tmp_path, cache_path)
+        
+        logger.info("✓ Created %d bars of historical data for %s", len(df), symbol)
         return df
     
-    def create_enhanced_signals(self, data: pd.DataFrame, symbol: str, num_signals: int = 10) -> List[Dict]:
+    def create_enhanced_signals(self, data: pd.DataFrame, symbol: str, num_signals: int = 10,
+                                rng: Optional[np.random.Generator] = None) -> List[Dict]:
         """
         Create enhanced trading signals with better quality filtering
         
@@ -154,14 +273,17 @@ class MultiSymbolBacktester:
             data: Historical OHLC data
             symbol: Currency pair symbol
             num_signals: Number of signals to generate
+            rng: Random generator to draw from (seeded from the symbol if omitted)
             
         Returns:
             List of enhanced signals
         """
-        logger.info(f"Creating {num_signals} enhanced signals for {symbol}")
+        logger.info("Creating %d enhanced signals for %s", num_signals, symbol)
         
-        signals = []
         data_len = len(data)
+        quotes = _quote_profile(symbol)
+        if rng is None:
+            rng = self._symbol_rng(symbol, SIGNAL_STREAM)
         
         # Use different signal densities for different market conditions
         # Ensure we have valid range for signal positions
@@ -169,105 +291,147 @@ class MultiSymbolBacktester:
         max_pos = max(min_pos + 1, data_len - 10)  # Leave 10 bars at the end
         
         if max_pos <= min_pos:
-            logger.warning(f"Not enough data for signal generation: {data_len} bars")
-            return signals
+            logger.warning("Not enough data for signal generation: %d bars", data_len)
+            return []
             
-        available_positions = range(min_pos, max_pos)
-        actual_signals = min(num_signals, len(available_positions))
-        
-        signal_positions = np.random.choice(
-            available_positions, size=actual_signals, replace=False
-        )
-        signal_positions.sort()
-        
-        for i, pos in enumerate(signal_positions):
-            # Analyze local market conditions around this position
-            lookback = min(50, pos)  # Use available data for lookback
-            window = data.iloc[max(0, pos-lookback):pos+1]
-            
-            current_price = data.iloc[pos]['Close']
-            
-            # Calculate technical indicators for signal quality
-            sma_20_period = min(20, len(window))
-            sma_50_period = min(50, len(window))
+        num_positions = max_pos - min_pos
+        actual_signals = min(num_signals, num_positions)
+        
+        # Candidate order does not matter; signals are ranked by score below
+        signal_positions = rng.choice(num_positions, size=actual_signals, replace=False) + min_pos
+        
+        # Calculate technical indicators for signal quality once over the whole
+        # series; early bars average whatever history is available
+        closes = data['Close']
+        sma_20_values = closes.rolling(20, min_periods=1).mean().to_numpy()
+        sma_50_values = closes.rolling(50, min_periods=1).mean().to_numpy()
+        volatility_values = closes.pct_change().rolling(50, min_periods=1).std().to_numpy()
+        close_values = closes.to_numpy()
+        timestamps = data.index
+        
+        # Analyze local market conditions at every candidate position at once
+        current_price = close_values[signal_positions]
+        sma_20 = sma_20_values[signal_positions]
+        sma_50 = sma_50_values[signal_positions]
+        
+        price_above_sma20 = current_price > sma_20
+        sma_trend = sma_20 > sma_50
+        
+        # Determine signal type based on technical analysis
+        agree_buy = price_above_sma20 & sma_trend
+        agree_sell = ~price_above_sma20 & ~sma_trend
+        mixed = ~(agree_buy | agree_sell)
+        
+        n = len(signal_positions)
+        is_buy = np.where(mixed, rng.random(n) < 0.5, agree_buy)
+        
+        # Mixed signals get lower confidence
+        confidence_draw = rng.random(n)
+        confidence = np.where(mixed, 0.5 + 0.3 * confidence_draw, 0.75 + 0.25 * confidence_draw)
+        
+        # Calculate entry levels based on signal type
+        stop_distance = rng.uniform(*quotes.stop_range, n)
+        target_distance = rng.uniform(*quotes.target_range, n)
+        
+        direction = np.where(is_buy, 1.0, -1.0)
+        entry_price = current_price
+        stop_loss = entry_price - direction * stop_distance
+        take_profit = entry_price + direction * target_distance
+        
+        # Calculate risk/reward ratio
+        risk = np.abs(entry_price - stop_loss)
+        reward = np.abs(take_profit - entry_price)
+        rr_ratio = np.divide(reward, risk, out=np.zeros(n), where=risk > 0)
+        
+        # Only include high-quality signals (confidence > 0.7) with good R:R ratio
+        keep = (confidence >= 0.7) & (rr_ratio >= self.settings.trading.min_rr_ratio)
+        
+        positions = signal_positions[keep]
+        signal_table = pd.DataFrame({
+            'timestamp': timestamps[positions],
+            'symbol': symbol,
+            'signal_type': np.where(is_buy[keep], SignalType.BUY, SignalType.SELL),  # Keep as enum for compatibility
+            'entry_price': entry_price[keep],
+            'stop_loss': stop_loss[keep],
+            'take_profit': take_profit[keep],
+            'confidence': confidence[keep],
+            'risk_reward_ratio': rr_ratio[keep],
+            'volatility': volatility_values[positions],
+            'technical_score': confidence[keep] * rr_ratio[keep],  # Combined quality score
+            'valid': True
+        })
+        
+        logger.info("✓ Created %d high-quality signals for %s", len(signal_table), symbol)
+        
+        # Return only the requested number of best signals, by quality score,
+        # as the signal dicts the backtest engine expects
+        return signal_table.nlargest(num_signals, 'technical_score').to_dict('records')
+    
+    def _backtest_symbol(self, symbol: str, days: int, timeframe: str,
+                         use_cache: bool = False) -> Optional[Dict]:
+        """
+        Generate data and signals for one symbol and backtest them
+        
+        Args:
+            symbol: Currency pair symbol
+            days: Days of historical data
+            timeframe: Timeframe for backtesting
+            use_cache: Reuse cached historical data from an earlier run
             
-            sma_20 = window['Close'].rolling(sma_20_period).mean().iloc[-1]
-            sma_50 = window['Close'].rolling(sma_50_period).mean().iloc[-1] if len(window) >= sma_50_period else sma_20
+        Returns:
+            Per-symbol results, or None if the symbol produced no backtest
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", '=' * 60)
+            logger.info("BACKTESTING %s", symbol)
+            logger.info("%s", '=' * 60)
+        
+        try:
+            # Data and signals come from separate symbol-seeded streams, so
+            # loading cached data leaves the signal draws unchanged
+            data = self.create_historical_data(symbol, days, timeframe, use_cache=use_cache)
             
-            price_above_sma20 = current_price > sma_20
-            sma_trend = sma_20 > sma_50
+            # Generate enhanced signals
+            signals = self.create_enhanced_signals(data, symbol, num_signals=15)
             
-            # Calculate volatility
-            returns = window['Close'].pct_change().dropna()
-            volatility = returns.std()
+            if not signals:
+                logger.warning("No valid signals generated for %s", symbol)
+                return None
             
-            # Determine signal type based on technical analysis
-            if price_above_sma20 and sma_trend:
-                signal_type = SignalType.BUY
-                confidence = 0.75 + np.random.uniform(0, 0.25)
-            elif not price_above_sma20 and not sma_trend:
-                signal_type = SignalType.SELL
-                confidence = 0.75 + np.random.uniform(0, 0.25)
-            else:
-                # Mixed signals - lower confidence
-                signal_type = np.random.choice([SignalType.BUY, SignalType.SELL])
-                confidence = 0.5 + np.random.uniform(0, 0.3)
+            # Initialize backtest engine for this symbol
+            engine = BacktestEngine(
+                initial_balance=self.settings.backtest.initial_balance,
+                commission=self.settings.backtest.commission,
+                max_spread=self.settings.trading.max_spread
+            )
             
-            # Only include high-quality signals (confidence > 0.7)
-            if confidence < 0.7:
-                continue
-                
-            # Calculate entry levels based on signal type
-            if signal_type == SignalType.BUY:
-                entry_price = current_price
-                if "JPY" in symbol:
-                    stop_loss = entry_price - np.random.uniform(0.2, 0.5)  # 20-50 pips
-                    take_profit = entry_price + np.random.uniform(0.4, 1.0)  # 40-100 pips
-                else:
-                    stop_loss = entry_price - np.random.uniform(0.0020, 0.0050)  # 20-50 pips
-                    take_profit = entry_price + np.random.uniform(0.0040, 0.0100)  # 40-100 pips
-            else:  # SELL
-                entry_price = current_price
-                if "JPY" in symbol:
-                    stop_loss = entry_price + np.random.uniform(0.2, 0.5)  # 20-50 pips
-                    take_profit = entry_price - np.random.uniform(0.4, 1.0)  # 40-100 pips
-                else:
-                    stop_loss = entry_price + np.random.uniform(0.0020, 0.0050)  # 20-50 pips
-                    take_profit = entry_price - np.random.uniform(0.0040, 0.0100)  # 40-100 pips
+            # Run backtest
+            results = engine.run_backtest(data, signals)
             
-            # Calculate risk/reward ratio
-            risk = abs(entry_price - stop_loss)
-            reward = abs(take_profit - entry_price)
-            rr_ratio = reward / risk if risk > 0 else 0
+            if 'error' in results:
+                logger.error("Backtest failed for %s: %s", symbol, results['error'])
+                return None
             
-            # Only include signals with good R:R ratio
-            if rr_ratio < self.settings.trading.min_rr_ratio:
-                continue
+            logger.info("✓ %s backtest completed - Return: %.2f%%", symbol, results.get('total_return', 0))
             
-            signal = {
-                'timestamp': data.index[pos],
+            return {
                 'symbol': symbol,
-                'signal_type': signal_type,  # Keep as enum for compatibility
-                'entry_price': entry_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'confidence': confidence,
-                'risk_reward_ratio': rr_ratio,
-                'volatility': volatility,
-                'technical_score': confidence * rr_ratio,  # Combined quality score
-                'valid': True
+                'timeframe': timeframe,
+                'days': days,
+                'data_points': len(data),
+                'signals_generated': len(signals),
+                'backtest_results': results,
+                'signal_details': signals
             }
             
-            signals.append(signal)
-        
-        # Sort by quality score and return best signals
-        signals.sort(key=lambda x: x['technical_score'], reverse=True)
-        
-        logger.info(f"✓ Created {len(signals)} high-quality signals for {symbol}")
-        return signals[:num_signals]  # Return only requested number of best signals
+        except Exception as e:
+            logger.error("Error backtesting %s: %s", symbol, e)
+            return None
     
     def run_multi_symbol_backtest(self, symbols: Optional[List[str]] = None, 
-                                 days: int = 30, timeframe: str = "H1") -> Dict:
+                                 days: int = 30, timeframe: str = "H1",
+                                 max_workers: int = 1,
+                                 use_cache: bool = False) -> Dict:
         """
         Run backtest across multiple symbols
         
@@ -275,6 +439,9 @@ class MultiSymbolBacktester:
             symbols: List of symbols to backtest (defaults to major pairs)
             days: Days of historical data
             timeframe: Timeframe for backtesting
+            max_workers: Worker processes for the per-symbol backtests
+                (1, the default, runs them in this process)
+            use_cache: Reuse historical data cached by an earlier run
             
         Returns:
             Comprehensive backtest results
@@ -282,8 +449,8 @@ class MultiSymbolBacktester:
         if symbols is None:
             symbols = self.settings.major_symbols
             
-        logger.info(f"Starting multi-symbol backtest for {len(symbols)} symbols")
-        logger.info(f"Symbols: {', '.join(symbols)}")
+        logger.info("Starting multi-symbol backtest for %d symbols", len(symbols))
+        logger.info("Symbols: %s", ', '.join(symbols))
         
         all_results = {}
         summary_stats = {
@@ -297,68 +464,40 @@ class MultiSymbolBacktester:
             'worst_return': float('inf')
         }
         
-        for symbol in symbols:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"BACKTESTING {symbol}")
-            logger.info(f"{'='*60}")
+        # Each symbol is independent (own generator and engine), so spread the
+        # symbols over worker processes and merge their results in order
+        if max_workers > 1 and len(symbols) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+                symbol_results = list(executor.map(
+                    self._backtest_symbol, symbols, repeat(days), repeat(timeframe), repeat(use_cache)
+                ))
+        else:
+            symbol_results = [
+                self._backtest_symbol(symbol, days, timeframe, use_cache) for symbol in symbols
+            ]
+        
+        for symbol, symbol_result in zip(symbols, symbol_results):
+            if symbol_result is None:
+                continue
             
-            try:
-                # Create historical data
-                data = self.create_historical_data(symbol, days, timeframe)
-                
-                # Generate enhanced signals
-                signals = self.create_enhanced_signals(data, symbol, num_signals=15)
-                
-                if not signals:
-                    logger.warning(f"No valid signals generated for {symbol}")
-                    continue
-                
-                # Initialize backtest engine for this symbol
-                engine = BacktestEngine(
-                    initial_balance=self.settings.backtest.initial_balance,
-                    commission=self.settings.backtest.commission,
-                    max_spread=self.settings.trading.max_spread
-                )
-                
-                # Run backtest
-                results = engine.run_backtest(data, signals)
-                
-                if 'error' in results:
-                    logger.error(f"Backtest failed for {symbol}: {results['error']}")
-                    continue
-                
-                # Store results
-                all_results[symbol] = {
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'days': days,
-                    'data_points': len(data),
-                    'signals_generated': len(signals),
-                    'backtest_results': results,
-                    'signal_details': signals
-                }
-                
-                # Update summary statistics
-                total_return = results.get('total_return', 0)
-                summary_stats['total_trades'] += len(results.get('trades', []))
-                summary_stats['total_return'] += total_return
-                
-                if total_return > 0:
-                    summary_stats['winning_symbols'] += 1
-                
-                if total_return > summary_stats['best_return']:
-                    summary_stats['best_return'] = total_return
-                    summary_stats['best_symbol'] = symbol
-                    
-                if total_return < summary_stats['worst_return']:
-                    summary_stats['worst_return'] = total_return
-                    summary_stats['worst_symbol'] = symbol
-                
-                logger.info(f"✓ {symbol} backtest completed - Return: {total_return:.2f}%")
+            all_results[symbol] = symbol_result
+            results = symbol_result['backtest_results']
+            
+            # Update summary statistics
+            total_return = results.get('total_return', 0)
+            summary_stats['total_trades'] += len(results.get('trades', []))
+            summary_stats['total_return'] += total_return
+            
+            if total_return > 0:
+                summary_stats['winning_symbols'] += 1
+            
+            if total_return > summary_stats['best_return']:
+                summary_stats['best_return'] = total_return
+                summary_stats['best_symbol'] = symbol
                 
-            except Exception as e:
-                logger.error(f"Error backtesting {symbol}: {str(e)}")
-                continue
+            if total_return < summary_stats['worst_return']:
+                summary_stats['worst_return'] = total_return
+                summary_stats['worst_symbol'] = symbol
         
         # Calculate average return
         if len(all_results) > 0:
@@ -390,6 +529,11 @@ class MultiSymbolBacktester:
         """
         Save backtest results to JSON file
         
+        The individual signals of every symbol are written as one flat table
+        next to the JSON (Parquet when pyarrow is installed, CSV otherwise);
+        each symbol's entry in the JSON names that file instead of nesting
+        its signal list.
+        
         Args:
             results: Backtest results dictionary
             filename: Optional filename (auto-generated if not provided)
@@ -405,29 +549,58 @@ class MultiSymbolBacktester:
         
         filepath = self.results_dir / filename
         
-        # Convert any non-serializable objects to strings
-        serializable_results = self._make_serializable(results)
+        symbol_results = results['symbol_results']
+        signals_path = self._save_signal_table(symbol_results, filepath)
         
-        with open(filepath, 'w') as f:
-            json.dump(serializable_results, f, indent=2, default=str)
+        # The JSON keeps per-symbol aggregates and a reference to the signal table
+        results = dict(results, symbol_results={
+            symbol: {
+                **{key: value for key, value in result.items() if key != 'signal_details'},
+                'signals_file': signals_path.name if signals_path else None
+            }
+            for symbol, result in symbol_results.items()
+        })
+        
+        # Non-JSON values are converted as the writer reaches them
+        dump_json(results, filepath, default=self._json_default)
         
-        logger.info(f"✓ Results saved to: {filepath}")
+        logger.info("✓ Results saved to: %s", filepath)
         return str(filepath)
     
-    def _make_serializable(self, obj):
-        """Convert object to JSON serializable format"""
-        if isinstance(obj, dict):
-            return {key: self._make_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif hasattr(obj, '__dict__'):
-            return self._make_serializable(obj.__dict__)
-        elif isinstance(obj, (datetime, pd.Timestamp)):
-            return obj.isoformat()
-        elif hasattr(obj, 'value'):  # Handle enum objects
-            return obj.value
+    def _save_signal_table(self, symbol_results: Dict, filepath: Path) -> Optional[Path]:
+        """
+        Write every symbol's signals as one flat table beside the results file
+        
+        Args:
+            symbol_results: Per-symbol results holding 'signal_details'
+            filepath: Path of the JSON results file
+            
+        Returns:
+            Path of the signal table, or None if there were no signals
+        """
+        signals = [
+            signal for result in symbol_results.values() for signal in result['signal_details']
+        ]
+        if not signals:
+            return None
+        
+        signal_table = pd.DataFrame(signals)
+        signal_table['signal_type'] = signal_table['signal_type'].map(lambda signal_type: signal_type.value)
+        
+        if PYARROW_AVAILABLE:
+            signals_path = filepath.with_name(f"{filepath.stem}_signals.parquet")
+            signal_table.to_parquet(signals_path, compression='zstd', index=False)
         else:
-            return obj
+            signals_path = filepath.with_name(f"{filepath.stem}_signals.csv")
+            signal_table.to_csv(signals_path, index=False)
+        
+        logger.info("✓ Signals saved to: %s", signals_path)
+        return signals_path
+    
+    @staticmethod
+    def _json_default(obj):
+        """Convert a value the JSON writer cannot serialize directly"""
+        return _json_converter(type(obj))(obj)
     
     def print_summary(self, results: Dict):
         """Print a comprehensive summary of backtest results"""
@@ -488,6 +661,7 @@ def main():
         'symbols': settings.major_symbols,  # Use major symbols for backtesting
         'days': 45,  # 45 days of historical data
         'timeframe': 'H1',
+        'max_workers': os.cpu_count() or 1,  # One worker process per CPU
     }
     
     print(f"📋 CONFIGURATION")
@@ -507,7 +681,8 @@ def main():
     results = backtester.run_multi_symbol_backtest(
         symbols=config['symbols'],
         days=config['days'],
-        timeframe=config['timeframe']
+        timeframe=config['timeframe'],
+        max_workers=config['max_workers']
     )
     
     # Save results
@@ -7,18 +7,29 @@ Live execution, backtesting, and comprehensive monitoring
 import sys
 import os
 import argparse
-from datetime import datetime
+import hashlib
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util as mp_util
+from dataclasses import asdict
+from datetime import datetime, timedelta
 from pathlib import Path
-import pandas as pd
+from typing import TYPE_CHECKING
 
 # Add project to path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from smc_forez.config.settings import Settings, Timeframe
-from smc_forez.execution.live_executor import LiveExecutor, ExecutionSettings
-from smc_forez.utils.logger import get_logger, cleanup_logger
-from smc_forez.analyzer import SMCAnalyzer
+# The smc_forez package pulls in pandas, numpy and the whole analyzer graph, so
+# it is imported inside the modes that use it and --help stays fast
+if TYPE_CHECKING:
+    from smc_forez.config.settings import Settings, Timeframe
+    from smc_forez.execution.live_executor import ExecutionSettings
+    from smc_forez.analyzer import SMCAnalyzer
+
+# Backtest results of earlier runs (--cache-backtest), keyed by their parameters
+BACKTEST_CACHE_DIR = Path(project_root) / '.cache' / 'bt'
 
 
 def print_banner():
@@ -49,8 +60,10 @@ def print_banner():
     print(banner)
 
 
-def create_default_settings() -> tuple[Settings, ExecutionSettings]:
+def create_default_settings() -> tuple['Settings', 'ExecutionSettings']:
     """Create default settings for production use"""
+    from smc_forez.config.settings import Settings, Timeframe
+    from smc_forez.execution.live_executor import ExecutionSettings
     
     # Main analyzer settings
     settings = Settings()
@@ -86,12 +99,15 @@ def create_default_settings() -> tuple[Settings, ExecutionSettings]:
 
 def run_live_mode(symbols: list, enable_execution: bool = False):
     """Run live trading/signal mode"""
+    from smc_forez.execution.live_executor import LiveExecutor
+    from smc_forez.utils.logger import get_logger, cleanup_logger
+    
     logger = get_logger(log_level="INFO")
     
     try:
         logger.info("🔥 STARTING LIVE MODE")
-        logger.info(f"📊 Symbols: {', '.join(symbols)}")
-        logger.info(f"💼 Execution: {'ENABLED' if enable_execution else 'DISABLED (Signal Only)'}")
+        logger.info("📊 Symbols: %s", ', '.join(symbols))
+        logger.info("💼 Execution: %s", 'ENABLED' if enable_execution else 'DISABLED (Signal Only)')
         
         # Create settings
         settings, execution_settings = create_default_settings()
@@ -113,13 +129,63 @@ def run_live_mode(symbols: list, enable_execution: bool = False):
     except KeyboardInterrupt:
         logger.info("⏹️ Live mode stopped by user")
     except Exception as e:
-        logger.error(f"❌ Error in live mode: {str(e)}")
+        logger.error("❌ Error in live mode: %s", e)
     finally:
         cleanup_logger()
 
 
-def run_backtest_mode(symbol: str, timeframe: str, days: int = 30):
-    """Run backtesting mode"""
+def _bt_cache_key(symbol: str, tf: 'Timeframe', start_date: str, end_date: str,
+                  settings: 'Settings') -> str:
+    """Hash of everything a backtest result depends on"""
+    params = {
+        'symbol': symbol,
+        'timeframe': tf.value,
+        'start_date': start_date,
+        'end_date': end_date,
+        'analysis': asdict(settings.analysis),
+        'trading': asdict(settings.trading),
+        'quality': asdict(settings.quality),
+        'backtest': asdict(settings.backtest),
+    }
+    payload = json.dumps(params, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cached_backtest(analyzer: 'SMCAnalyzer', symbol: str, tf: 'Timeframe',
+                     start_date: str, end_date: str) -> dict:
+    """Run a backtest, reusing the stored results of an identical earlier run"""
+    key = _bt_cache_key(symbol, tf, start_date, end_date, analyzer.settings)
+    cache_file = BACKTEST_CACHE_DIR / f"{key}.pkl"
+    
+    if cache_file.exists():
+        return pickle.loads(cache_file.read_bytes())
+    
+    results = analyzer.run_backtest(
+        symbol=symbol,
+        timeframe=tf,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    # Failed runs are not cached so that they are retried next time
+    if 'error' not in results:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(results))
+    
+    return results
+
+
+def run_backtest_mode(symbol: str, timeframe: str, days: int = 30, use_cache: bool = False):
+    """
+    Run backtesting mode
+    
+    With use_cache, the results of an earlier run with the same symbol,
+    timeframe, dates and settings are reused instead of fetching fresh data.
+    """
+    from smc_forez.analyzer import SMCAnalyzer
+    from smc_forez.config.settings import Timeframe
+    from smc_forez.utils.logger import get_logger, cleanup_logger
+    
     logger = get_logger(log_level="INFO")
     
     try:
@@ -129,33 +195,34 @@ def run_backtest_mode(symbol: str, timeframe: str, days: int = 30):
         settings, _ = create_default_settings()
         analyzer = SMCAnalyzer(settings)
         
-        # Convert timeframe string to enum
-        tf_map = {
-            'M1': Timeframe.M1, 'M5': Timeframe.M5, 'M15': Timeframe.M15,
-            'H1': Timeframe.H1, 'H4': Timeframe.H4, 'D1': Timeframe.D1
-        }
-        tf = tf_map.get(timeframe.upper(), Timeframe.H1)
+        # Convert timeframe string to enum (member names match the CLI choices)
+        tf = Timeframe.__members__.get(timeframe.upper(), Timeframe.H1)
         
         # Calculate date range
         end_date = datetime.now()
-        start_date = end_date - pd.Timedelta(days=days)
+        start_date = end_date - timedelta(days=days)
+        start_str = start_date.strftime('%Y-%m-%d')
+        end_str = end_date.strftime('%Y-%m-%d')
         
         print(f"\n📊 BACKTESTING PARAMETERS")
         print(f"Symbol: {symbol}")
         print(f"Timeframe: {tf.value}")
-        print(f"Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        print(f"Period: {start_str} to {end_str}")
         print(f"Duration: {days} days\n")
         
-        # Run backtest
-        results = analyzer.run_backtest(
-            symbol=symbol,
-            timeframe=tf,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d')
-        )
+        # Run backtest (or reuse the results of an identical earlier run)
+        if use_cache:
+            results = _cached_backtest(analyzer, symbol, tf, start_str, end_str)
+        else:
+            results = analyzer.run_backtest(
+                symbol=symbol,
+                timeframe=tf,
+                start_date=start_str,
+                end_date=end_str
+            )
         
         if 'error' in results:
-            logger.error(f"❌ Backtest failed: {results['error']}")
+            logger.error("❌ Backtest failed: %s", results['error'])
             return
         
         # Display results
@@ -179,60 +246,100 @@ def run_backtest_mode(symbol: str, timeframe: str, days: int = 30):
         print(f"\n💾 Results saved to: {filename}")
         
     except Exception as e:
-        logger.error(f"❌ Error in backtest mode: {str(e)}")
+        logger.error("❌ Error in backtest mode: %s", e)
     finally:
         cleanup_logger()
 
 
+# Analyzer of the current process in analysis mode (one per worker process)
+_analyzer = None
+
+
+def _init_analyzer(settings: 'Settings') -> bool:
+    """Create this process's analyzer and connect its data source"""
+    from smc_forez.analyzer import SMCAnalyzer
+    
+    global _analyzer
+    _analyzer = SMCAnalyzer(settings)
+    return _analyzer.connect_data_source()
+
+
+def _init_worker(settings: 'Settings'):
+    """
+    Pool initializer: set up the worker's analyzer and disconnect it on exit
+    
+    Forked pool workers leave through os._exit, which skips atexit handlers,
+    so the disconnect is registered as a multiprocessing finalizer instead.
+    """
+    _init_analyzer(settings)
+    mp_util.Finalize(None, _analyzer.disconnect_data_source, exitpriority=10)
+
+
+def _analyze_symbol(symbol: str) -> dict:
+    """Multi-timeframe analysis summary for one symbol on this process's analyzer"""
+    try:
+        analysis = _analyzer.analyze_multi_timeframe(symbol)
+        
+        if 'error' in analysis:
+            return {'error': analysis['error']}
+        
+        return {'summary': _analyzer.get_analysis_summary(analysis)}
+    
+    except Exception as e:
+        return {'exception': str(e)}
+
+
 def run_analysis_mode(symbols: list):
     """Run one-time analysis mode"""
+    from smc_forez.utils.logger import get_logger, cleanup_logger
+    
     logger = get_logger(log_level="INFO")
     
     try:
         logger.info("🔍 STARTING ANALYSIS MODE")
         
-        # Create analyzer
         settings, _ = create_default_settings()
-        analyzer = SMCAnalyzer(settings)
-        
-        # Connect to data source
-        if not analyzer.connect_data_source():
-            logger.warning("⚠️ Data source connection failed - using sample data")
         
         print(f"\n🔍 ANALYZING {len(symbols)} SYMBOLS")
         print("="*60)
         
-        # Analyze each symbol
-        for symbol in symbols:
-            try:
-                print(f"\n📊 {symbol}")
-                print("-" * 40)
-                
-                # Get multi-timeframe analysis
-                analysis = analyzer.analyze_multi_timeframe(symbol)
-                
-                if 'error' in analysis:
-                    print(f"❌ Error: {analysis['error']}")
-                    continue
-                
-                # Print summary
-                summary = analyzer.get_analysis_summary(analysis)
-                print(summary)
-                
-            except Exception as e:
-                logger.error(f"❌ Error analyzing {symbol}: {str(e)}")
-                continue
+        # Symbols are independent, so analyze them in worker processes (each
+        # with its own analyzer and connection) and report in the original order;
+        # with a single worker the analysis runs on this process's own connection
+        max_workers = min(len(symbols), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(settings,)) as executor:
+                results = list(executor.map(_analyze_symbol, symbols))
+        else:
+            if not _init_analyzer(settings):
+                logger.warning("⚠️ Data source connection failed - using sample data")
+            results = [_analyze_symbol(symbol) for symbol in symbols]
+            _analyzer.disconnect_data_source()
         
-        analyzer.disconnect_data_source()
+        for symbol, result in zip(symbols, results):
+            print(f"\n📊 {symbol}")
+            print("-" * 40)
+            
+            if 'exception' in result:
+                logger.error("❌ Error analyzing %s: %s", symbol, result['exception'])
+                continue
+            
+            if 'error' in result:
+                print(f"❌ Error: {result['error']}")
+                continue
+            
+            # Print summary
+            print(result['summary'])
         
     except Exception as e:
-        logger.error(f"❌ Error in analysis mode: {str(e)}")
+        logger.error("❌ Error in analysis mode: %s", e)
     finally:
         cleanup_logger()
 
 
-def main():
-    """Main application entry point"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(
         description="SMC Forez - Professional Forex Analyzer with Smart Money Concepts",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -286,6 +393,12 @@ Examples:
         help='Number of days for backtesting'
     )
     
+    parser.add_argument(
+        '--cache-backtest',
+        action='store_true',
+        help='Reuse the results of an identical earlier backtest run (same dates and settings)'
+    )
+    
     parser.add_argument(
         '--execute', 
         action='store_true',
@@ -299,7 +412,12 @@ Examples:
         help='Logging level'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main application entry point"""
+    args = build_parser().parse_args()
     
     # Print banner
     print_banner()
@@ -316,7 +434,7 @@ Examples:
         if args.mode == 'live':
             run_live_mode(args.symbols, args.execute)
         elif args.mode == 'backtest':
-            run_backtest_mode(args.symbol, args.timeframe, args.days)
+            run_backtest_mode(args.symbol, args.timeframe, args.days, args.cache_backtest)
         elif args.mode == 'analyze':
             run_analysis_mode(args.symbols)
     
@@ -5,12 +5,16 @@ This script integrates the actual SMC analysis pipeline instead of using dummy s
 """
 import sys
 import os
+import argparse
+import hashlib
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-import json
-from typing import Dict, List, Optional
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Add project to path
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -20,11 +24,27 @@ from smc_forez.analyzer import SMCAnalyzer
 from smc_forez.config.settings import Settings, Timeframe
 from smc_forez.backtesting import BacktestEngine, Trade, PerformanceMetrics
 from smc_forez.signals.signal_generator import SignalType
+from smc_forez.utils.json_io import dump_json, load_json
+
+# Try to import pyarrow - graceful fallback to the default CSV parser if not available
+try:
+    import pyarrow  # CSV engine used by pandas
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# pandas 2 needs format='ISO8601' to parse ISO timestamps of mixed precision
+# in one call; pandas 1.5 does not know that format and parses them per value
+ISO8601_FORMAT = {'format': 'ISO8601'} if int(pd.__version__.split('.')[0]) >= 2 else {}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Parsed copies of CSV data files (opt-in), reused while the source file is unchanged
+DATA_CACHE_DIR = Path(project_root) / '.cache' / 'data'
+# Bump whenever the loader changes the frames it produces, so stale entries are ignored
+DATA_CACHE_VERSION = 1
 
 
 def run_enhanced_backtest(symbol: str = "EURUSD", days: int = 30, timeframe: str = "H1") -> Dict:
@@ -119,6 +139,19 @@ def run_enhanced_backtest(symbol: str = "EURUSD", days: int = 30, timeframe: str
         return {'error': str(e)}
 
 
+def _run_config(config: Dict) -> Tuple[Dict, Dict]:
+    """Run one backtest configuration (picklable entry point for worker processes)"""
+    try:
+        results = run_enhanced_backtest(
+            symbol=config['symbol'],
+            timeframe=config['timeframe'],
+            days=config['days']
+        )
+    except Exception as e:
+        results = {'error': str(e)}
+    return config, results
+
+
 def print_enhanced_results(results: Dict):
     """Print enhanced backtest results with analysis details"""
     print("\n" + "="*80)
@@ -196,12 +229,42 @@ def print_enhanced_results(results: Dict):
             print(f"   ... and {len(trades) - 5} more trades")
 
 
-def load_data_from_file(filepath: str) -> Optional[pd.DataFrame]:
+def _downcast_volume(df: pd.DataFrame) -> pd.DataFrame:
+    """Store integer volume as int32; prices stay float64 for the P&L maths"""
+    if 'Volume' in df.columns and pd.api.types.is_integer_dtype(df['Volume']):
+        return df.astype({'Volume': np.int32}, copy=False)
+    return df
+
+
+def _data_cache_path(filepath: str) -> Path:
+    """Cache file for a data file, keyed by the loader version and the file's path, size and mtime"""
+    stat = os.stat(filepath)
+    source = f"{DATA_CACHE_VERSION}:{os.path.abspath(filepath)}:{stat.st_size}:{stat.st_mtime_ns}"
+    key = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+    return DATA_CACHE_DIR / f"{key}.pkl"
+
+
+def _read_ohlc_csv(filepath: str) -> pd.DataFrame:
+    """Read a CSV whose first column holds the bar timestamps into a time-indexed frame"""
+    if PYARROW_AVAILABLE:
+        # The multithreaded pyarrow parser does not take index_col/parse_dates,
+        # so the index is set up afterwards
+        df = pd.read_csv(filepath, engine='pyarrow')
+        df = df.set_index(df.columns[0])
+        df.index = pd.to_datetime(df.index)
+        return df
+    
+    return pd.read_csv(filepath, index_col=0, parse_dates=True)
+
+
+def load_data_from_file(filepath: str, use_cache: bool = False) -> Optional[pd.DataFrame]:
     """
     Load OHLC data from CSV file
     
     Args:
         filepath: Path to CSV file with OHLC data
+        use_cache: Keep the parsed frame under DATA_CACHE_DIR, so later runs
+            on the same unchanged file skip CSV parsing
         
     Returns:
         DataFrame with OHLC data or None if failed
@@ -211,7 +274,13 @@ def load_data_from_file(filepath: str) -> Optional[pd.DataFrame]:
             print(f"❌ File not found: {filepath}")
             return None
         
-        df = pd.read_csv(filepath, index_col=0, parse_dates=True)
+        cache_path = _data_cache_path(filepath) if use_cache else None
+        if cache_path is not None and cache_path.exists():
+            df = pd.read_pickle(cache_path)
+            print(f"✓ Loaded {len(df)} rows from {filepath} (cached)")
+            return df
+        
+        df = _read_ohlc_csv(filepath)
         
         # Validate required columns
         required_cols = ['Open', 'High', 'Low', 'Close']
@@ -221,6 +290,21 @@ def load_data_from_file(filepath: str) -> Optional[pd.DataFrame]:
             print(f"❌ Missing required columns: {missing_cols}")
             return None
         
+        # Tick volumes fit in int32, which halves that column
+        df = _downcast_volume(df)
+        
+        # Caching is best effort; a read-only checkout just means no reuse.
+        # The frame is written to a temporary file first so a partial write
+        # is never picked up as a cache entry
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                df.to_pickle(tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning("Could not cache %s: %s", filepath, e)
+        
         print(f"✓ Loaded {len(df)} rows from {filepath}")
         return df
         
@@ -244,16 +328,17 @@ def load_signals_from_file(filepath: str) -> Optional[List[Dict]]:
             print(f"❌ File not found: {filepath}")
             return None
         
-        with open(filepath, 'r') as f:
-            signals_data = json.load(f)
+        with open(filepath, 'rb') as f:
+            signals_data = load_json(f)
         
-        # Convert string timestamps back to datetime objects
-        signals = []
-        for signal in signals_data:
-            signal_copy = signal.copy()
-            signal_copy['timestamp'] = pd.to_datetime(signal['timestamp'])
-            signal_copy['signal_type'] = SignalType(signal['signal_type'])
-            signals.append(signal_copy)
+        # Convert string timestamps back to datetime objects, all in one call
+        timestamps = pd.to_datetime([signal['timestamp'] for signal in signals_data],
+                                    **ISO8601_FORMAT)
+        signal_types = {signal_type.value: signal_type for signal_type in SignalType}
+        signals = [
+            {**signal, 'timestamp': timestamp, 'signal_type': signal_types[signal['signal_type']]}
+            for signal, timestamp in zip(signals_data, timestamps)
+        ]
         
         print(f"✓ Loaded {len(signals)} signals from {filepath}")
         return signals
@@ -263,8 +348,74 @@ def load_signals_from_file(filepath: str) -> Optional[List[Dict]]:
         return None
 
 
-def main():
+def _json_default(obj):
+    """Fallback conversion for values the JSON writer cannot encode directly"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
+
+def export_enhanced_results(results: Dict, config: Dict):
+    """Export successful backtest results to a timestamped JSON file"""
+    if 'error' in results:
+        return
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"enhanced_backtest_{config['symbol']}_{config['timeframe']}_{timestamp}.json"
+    
+    try:
+        dump_json(results, filename, default=_json_default)
+        print(f"\n💾 Enhanced results exported to: {filename}")
+        
+    except Exception as e:
+        print(f"\n⚠️  Could not export results: {e}")
+
+
+def run_all_configs(config_options: List[Dict]):
+    """
+    Run every configuration in its own worker process
+    
+    Each worker builds its own settings and analyzer; results are reported
+    as the backtests finish.
+    """
+    max_workers = min(len(config_options), os.cpu_count() or 1)
+    print(f"\n⚡ Running {len(config_options)} configurations on {max_workers} worker(s)")
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_config, config) for config in config_options]
+        
+        for future in as_completed(futures):
+            config, results = future.result()
+            print(f"\n✓ Finished: {config['name']} ({config['symbol']} {config['timeframe']}, {config['days']} days)")
+            print_enhanced_results(results)
+            export_enhanced_results(results, config)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="Enhanced SMC backtest runner with multi-timeframe analysis"
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Run every preset configuration in parallel instead of prompting for one'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
     """Main function to run enhanced backtests with real SMC analysis"""
+    args = build_parser().parse_args(argv)
+    
     print("🚀 SMC FOREZ - ENHANCED BACKTEST RUNNER WITH MULTI-TIMEFRAME ANALYSIS")
     print("="*80)
     
@@ -293,6 +444,11 @@ def main():
         }
     ]
     
+    if args.all:
+        run_all_configs(config_options)
+        print("\n✅ Enhanced backtests completed!")
+        return
+    
     print("📋 BACKTEST CONFIGURATION OPTIONS")
     print("-" * 50)
     for i, config in enumerate(config_options, 1):
@@ -349,30 +505,7 @@ def main():
     print_enhanced_results(results)
     
     # Export results
-    if 'error' not in results:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"enhanced_backtest_{config['symbol']}_{config['timeframe']}_{timestamp}.json"
-        
-        try:
-            # Make results JSON serializable
-            export_results = {}
-            for key, value in results.items():
-                if isinstance(value, (datetime, pd.Timestamp)):
-                    export_results[key] = value.isoformat()
-                elif hasattr(value, 'to_dict'):
-                    export_results[key] = value.to_dict()
-                elif hasattr(value, '__dict__'):
-                    export_results[key] = value.__dict__
-                else:
-                    export_results[key] = value
-            
-            with open(filename, 'w') as f:
-                json.dump(export_results, f, indent=2, default=str)
-            
-            print(f"\n💾 Enhanced results exported to: {filename}")
-            
-        except Exception as e:
-            print(f"\n⚠️  Could not export results: {e}")
+    export_enhanced_results(results, config)
     
     print("\n✅ Enhanced backtest completed!")
     print("\n💡 KEY IMPROVEMENTS:")
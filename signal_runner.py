@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import logging
 import json
 import time
+import heapq
 from typing import Dict, List, Optional
 from pathlib import Path
 import threading
@@ -466,10 +467,10 @@ class ContinuousSignalRunner:
         print(f"{'Symbol':<8} {'Type':<4} {'Entry':<10} {'Confidence':<10} {'R:R':<6} {'Quality':<7}")
         print("-" * 70)
         
-        # Sort by quality score
-        sorted_signals = sorted(signals, key=lambda x: x.get('quality_score', 0), reverse=True)
+        # Show top 10 signals by quality score
+        top_signals = heapq.nlargest(10, signals, key=lambda x: x.get('quality_score', 0))
         
-        for signal in sorted_signals[:10]:  # Show top 10 signals
+        for signal in top_signals:
             symbol = signal['symbol']
             signal_type = signal['signal_type'].value.upper() if hasattr(signal['signal_type'], 'value') else str(signal['signal_type']).upper()
             entry = signal['entry_price']
@@ -80,7 +80,7 @@ class SignalQualityFilter:
         recommendation = analysis.get('recommendation', {})
         confidence = recommendation.get('confidence', 'LOW')
         trend_alignment = analysis.get('trend_alignment', {})
-        alignment_score = len([v for v in trend_alignment.values() if v == 'aligned'])
+        alignment_score = sum(1 for v in trend_alignment.values() if v == 'aligned')
         
         if confidence == 'HIGH' and alignment_score >= 3:
             score += 0.25
@@ -346,7 +346,7 @@ class EnhancedSignalRunner:
             Filename of saved file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = f"enhanced_signals_{timestamp}.json"
         
         # Create directory if it doesn't exist
@@ -379,7 +379,7 @@ class EnhancedSignalRunner:
     def print_signal_summary(self, signals: List[Dict]):
         """Print a formatted summary of generated signals"""
         print("\n" + "="*80)
-        print("ENHANCED SIGNAL GENERATION SUMMARY - " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        print("ENHANCED SIGNAL GENERATION SUMMARY - " + time.strftime('%Y-%m-%d %H:%M:%S'))
         print("="*80)
         
         if not signals:
@@ -390,7 +390,9 @@ class EnhancedSignalRunner:
         buy_signals = [s for s in signals if s['signal_type'] == SignalType.BUY]
         sell_signals = [s for s in signals if s['signal_type'] == SignalType.SELL]
         
-        avg_confidence = np.mean([s.get('quality_score', 0) for s in signals])
+        quality_scores = np.fromiter((s.get('quality_score', 0) for s in signals),
+                                     dtype=float, count=len(signals))
+        avg_confidence = quality_scores.mean()
         avg_rr = np.mean([s.get('risk_reward_ratio', 0) for s in signals])
         
         print(f"📊 Signal Statistics:")
@@ -406,8 +408,11 @@ class EnhancedSignalRunner:
         print("Symbol   Type Entry      Quality R:R    Confidence")
         print("-" * 70)
         
-        # Sort by quality score and show top 10
-        top_signals = sorted(signals, key=lambda x: x.get('quality_score', 0), reverse=True)[:10]
+        # Select the top 10 by quality score without sorting every signal
+        top_count = min(10, len(signals))
+        top_idx = np.argpartition(-quality_scores, top_count - 1)[:top_count]
+        top_idx = top_idx[np.argsort(-quality_scores[top_idx], kind='stable')]
+        top_signals = [signals[i] for i in top_idx]
         
         for signal in top_signals:
             symbol = signal['symbol'][:8]
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import logging
 import json
 import time
+import heapq
 from typing import Dict, List, Optional
 from pathlib import Path
 import threading
@@ -123,11 +124,8 @@ class SignalQualityFilter:
                 
                 filtered_signals.append(enhanced_signal)
         
-        # Sort by quality score
-        filtered_signals.sort(key=lambda x: x['quality_score'], reverse=True)
-        
-        # Limit to top signals per symbol
-        return filtered_signals[:3]  # Max 3 signals per symbol
+        # Keep the top signals per symbol by quality score
+        return heapq.nlargest(3, filtered_signals, key=lambda x: x['quality_score'])  # Max 3 signals per symbol
 
 
 class EnhancedSignalRunner:
@@ -279,7 +277,7 @@ class EnhancedSignalRunner:
             Filename of saved file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = f"enhanced_signals_{timestamp}.json"
         
         # Create directory if it doesn't exist
@@ -312,7 +310,7 @@ class EnhancedSignalRunner:
     def print_signal_summary(self, signals: List[Dict]):
         """Print a formatted summary of generated signals"""
         print("\n" + "="*80)
-        print("ENHANCED SIGNAL GENERATION SUMMARY - " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        print("ENHANCED SIGNAL GENERATION SUMMARY - " + time.strftime('%Y-%m-%d %H:%M:%S'))
         print("="*80)
         
         if not signals:
@@ -323,7 +321,9 @@ class EnhancedSignalRunner:
         buy_signals = [s for s in signals if s['signal_type'] == SignalType.BUY]
         sell_signals = [s for s in signals if s['signal_type'] == SignalType.SELL]
         
-        avg_confidence = np.mean([s.get('quality_score', 0) for s in signals])
+        quality_scores = np.fromiter((s.get('quality_score', 0) for s in signals),
+                                     dtype=float, count=len(signals))
+        avg_confidence = quality_scores.mean()
         avg_rr = np.mean([s.get('risk_reward_ratio', 0) for s in signals])
         
         print(f"📊 Signal Statistics:")
@@ -339,8 +339,11 @@ class EnhancedSignalRunner:
         print("Symbol   Type Entry      Quality R:R    Confidence")
         print("-" * 70)
         
-        # Sort by quality score and show top 10
-        top_signals = sorted(signals, key=lambda x: x.get('quality_score', 0), reverse=True)[:10]
+        # Select the top 10 by quality score without sorting every signal
+        top_count = min(10, len(signals))
+        top_idx = np.argpartition(-quality_scores, top_count - 1)[:top_count]
+        top_idx = top_idx[np.argsort(-quality_scores[top_idx], kind='stable')]
+        top_signals = [signals[i] for i in top_idx]
         
         for signal in top_signals:
             symbol = signal['symbol'][:8]
@@ -5,6 +5,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import sys
 import os
@@ -327,9 +328,56 @@ class SMCAnalyzer:
         except Exception as e:
             logger.error(f"Error logging signal decision: {str(e)}")
     
+    def _scan_symbol(self, symbol: str, timeframes: List[Timeframe],
+                     use_quality_analysis: bool) -> Optional[Dict]:
+        """Analyze one symbol and return its opportunity, if any"""
+        try:
+            # Use institutional-grade analysis if quality analyzer is available
+            if use_quality_analysis and self.quality_analyzer:
+                analysis = self.analyze_institutional_grade_signal(symbol, timeframes)
+                
+                if 'error' not in analysis and analysis.get('institutional_grade', False):
+                    quality_report = analysis.get('quality_report', {})
+                    
+                    return {
+                        'symbol': symbol,
+                        'analysis_timestamp': analysis.get('analysis_timestamp'),
+                        'quality_score': quality_report.get('total_quality_score', 0),
+                        'quality_grade': quality_report.get('quality_grade', 'unknown'),
+                        'signal_summary': quality_report.get('signal_summary', {}),
+                        'should_execute': quality_report.get('should_execute', False),
+                        'decision_reasoning': quality_report.get('decision_reasoning', []),
+                        'analysis_type': 'institutional_grade'
+                    }
+            else:
+                # Fallback to standard multi-timeframe analysis
+                analysis = self.analyze_multi_timeframe(symbol, timeframes)
+                
+                if 'error' not in analysis:
+                    recommendation = analysis.get('recommendation', {})
+                    
+                    # Check if there's a valid trading opportunity
+                    if (recommendation.get('confidence') in ['HIGH', 'MODERATE'] and
+                        recommendation.get('action').value != 'wait'):
+                        
+                        return {
+                            'symbol': symbol,
+                            'recommendation': recommendation,
+                            'analysis_timestamp': analysis.get('analysis_timestamp'),
+                            'trend_alignment': analysis.get('trend_alignment'),
+                            'signal_confluence': analysis.get('signal_confluence'),
+                            'analysis_type': 'standard'
+                        }
+                    
+        except Exception as e:
+            logger.warning(f"Error analyzing {symbol}: {str(e)}")
+        
+        return None
+    
     def get_current_opportunities(self, symbols: List[str], 
                                  timeframes: Optional[List[Timeframe]] = None,
-                                 use_quality_analysis: bool = True) -> List[Dict]:
+                                 use_quality_analysis: bool = True,
+                                 max_workers: int = 1) -> List[Dict]:
         """
         Scan multiple symbols for current trading opportunities
         
@@ -337,6 +385,9 @@ class SMCAnalyzer:
             symbols: List of currency pair symbols to scan
             timeframes: List of timeframes to analyze
             use_quality_analysis: Use institutional-grade quality analysis
+            max_workers: Number of symbols to analyze concurrently. Symbols are
+                scanned on threads sharing this analyzer, so only raise this
+                when the data source is safe to call from several threads
             
         Returns:
             List of trading opportunities
@@ -344,51 +395,18 @@ class SMCAnalyzer:
         try:
             logger.info(f"Scanning {len(symbols)} symbols for opportunities")
             
-            opportunities = []
             timeframes = timeframes or self.settings.timeframes
             
-            for symbol in symbols:
-                try:
-                    # Use institutional-grade analysis if quality analyzer is available
-                    if use_quality_analysis and self.quality_analyzer:
-                        analysis = self.analyze_institutional_grade_signal(symbol, timeframes)
-                        
-                        if 'error' not in analysis and analysis.get('institutional_grade', False):
-                            quality_report = analysis.get('quality_report', {})
-                            
-                            opportunities.append({
-                                'symbol': symbol,
-                                'analysis_timestamp': analysis.get('analysis_timestamp'),
-                                'quality_score': quality_report.get('total_quality_score', 0),
-                                'quality_grade': quality_report.get('quality_grade', 'unknown'),
-                                'signal_summary': quality_report.get('signal_summary', {}),
-                                'should_execute': quality_report.get('should_execute', False),
-                                'decision_reasoning': quality_report.get('decision_reasoning', []),
-                                'analysis_type': 'institutional_grade'
-                            })
-                    else:
-                        # Fallback to standard multi-timeframe analysis
-                        analysis = self.analyze_multi_timeframe(symbol, timeframes)
-                        
-                        if 'error' not in analysis:
-                            recommendation = analysis.get('recommendation', {})
-                            
-                            # Check if there's a valid trading opportunity
-                            if (recommendation.get('confidence') in ['HIGH', 'MODERATE'] and
-                                recommendation.get('action').value != 'wait'):
-                                
-                                opportunities.append({
-                                    'symbol': symbol,
-                                    'recommendation': recommendation,
-                                    'analysis_timestamp': analysis.get('analysis_timestamp'),
-                                    'trend_alignment': analysis.get('trend_alignment'),
-                                    'signal_confluence': analysis.get('signal_confluence'),
-                                    'analysis_type': 'standard'
-                                })
-                            
-                except Exception as e:
-                    logger.warning(f"Error analyzing {symbol}: {str(e)}")
-                    continue
+            def scan(symbol):
+                return self._scan_symbol(symbol, timeframes, use_quality_analysis)
+            
+            if max_workers > 1 and len(symbols) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+                    results = list(executor.map(scan, symbols))
+            else:
+                results = [scan(symbol) for symbol in symbols]
+            
+            opportunities = [opp for opp in results if opp is not None]
             
             # Sort opportunities by quality score (institutional) or confidence (standard)
             def sort_key(x):
@@ -5,10 +5,10 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-import json
 import logging
 from dataclasses import dataclass
-from ..signals.signal_generator import SignalType
+from ..signals.signal_generator import SignalType, BUY_CODE, SIDE_CODES
+from ..utils.json_io import dump_json
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +30,11 @@ class Trade:
     commission: float = 0.0
     status: str = "open"  # open, closed, stopped_out, target_hit
     exit_reason: str = ""
+    side: Optional[np.int8] = None  # BUY_CODE/SELL_CODE, derived from signal_type if not given
+    
+    def __post_init__(self):
+        if self.side is None:
+            self.side = SIDE_CODES.get(self.signal_type)
 
 
 @dataclass
@@ -201,6 +206,7 @@ class BacktestEngine:
                 entry_time=timestamp,
                 exit_time=None,
                 signal_type=signal_type,
+                side=signal.get('side'),
                 entry_price=entry_price,
                 exit_price=None,
                 stop_loss=stop_loss,
@@ -247,7 +253,7 @@ class BacktestEngine:
             trades_to_close = []
             
             for trade in self.open_trades:
-                if trade.signal_type == SignalType.BUY:
+                if trade.side == BUY_CODE:
                     # For buy trades, use bid price for exit
                     current_price = current_bid
                     
@@ -303,7 +309,7 @@ class BacktestEngine:
             trade: Trade to close
         """
         try:
-            if trade.signal_type == SignalType.BUY:
+            if trade.side == BUY_CODE:
                 # Buy trade: profit when exit > entry
                 pnl = (trade.exit_price - trade.entry_price) * trade.size * 100000  # Convert to account currency
                 pnl_pips = (trade.exit_price - trade.entry_price) * 10000
@@ -334,6 +340,15 @@ class BacktestEngine:
         except Exception as e:
             logger.error(f"Error closing trade: {str(e)}")
     
+    def _record_equity(self, timestamp: datetime):
+        """Append a periodic balance sample to the equity curve"""
+        self.equity_curve.append({
+            'timestamp': timestamp,
+            'balance': self.current_balance,
+            'trade_pnl': 0,
+            'cumulative_pnl': self.current_balance - self.initial_balance
+        })
+    
     def run_backtest(self, data: pd.DataFrame, signals: List[Dict]) -> Dict:
         """
         Run complete backtest on historical data
@@ -354,34 +369,66 @@ class BacktestEngine:
             self.equity_curve = []
             self.open_trades = []
             
-            # Create signal lookup for efficiency
-            signal_lookup = {signal['timestamp']: signal for signal in signals}
+            # Create signal lookup for efficiency. On a DatetimeIndex bars and
+            # signals are matched by int64 epoch-ns, so signal timestamps may be
+            # Timestamps, datetimes or raw epoch-ns integers
+            if isinstance(data.index, pd.DatetimeIndex):
+                bar_keys = data.index.asi8
+                signal_lookup = {pd.Timestamp(signal['timestamp']).value: signal
+                                 for signal in signals}
+                has_signal = np.isin(bar_keys, np.fromiter(signal_lookup, dtype=np.int64,
+                                                           count=len(signal_lookup)))
+                bar_keys = bar_keys.tolist()
+            else:
+                bar_keys = data.index
+                signal_lookup = {signal['timestamp']: signal for signal in signals}
+                has_signal = np.fromiter((key in signal_lookup for key in bar_keys),
+                                         dtype=bool, count=len(bar_keys))
+            
+            # Bar positions carrying a signal, resolved once up front
+            signal_positions = np.flatnonzero(has_signal)
+            has_signal = has_signal.tolist()
+            
+            timestamps = list(data.index)
+            closes = data['Close'].to_numpy()
+            n_bars = len(data)
             
             # Simulate trading
-            for i, (timestamp, row) in enumerate(data.iterrows()):
+            i = 0
+            while i < n_bars:
+                if not self.open_trades:
+                    # Nothing can change until the next signal bar, so skip
+                    # straight to it, still sampling the (flat) equity curve
+                    next_pos = np.searchsorted(signal_positions, i)
+                    next_i = int(signal_positions[next_pos]) if next_pos < len(signal_positions) else n_bars
+                    for j in range(-(-i // 100) * 100, next_i, 100):
+                        self._record_equity(timestamps[j])
+                    i = next_i
+                    if i >= n_bars:
+                        break
+                
+                timestamp = timestamps[i]
+                
                 # Create current market data
+                close = closes[i]
                 current_data = {
-                    'bid': row['Close'],  # Simplified - use close as bid
-                    'ask': row['Close'] + 0.00020,  # Add 2 pip spread
+                    'bid': close,  # Simplified - use close as bid
+                    'ask': close + 0.00020,  # Add 2 pip spread
                     'spread': 2.0
                 }
                 
                 # Check for new signals
-                if timestamp in signal_lookup:
-                    signal = signal_lookup[timestamp]
-                    self.enter_trade(timestamp, signal, current_data)
+                if has_signal[i]:
+                    self.enter_trade(timestamp, signal_lookup[bar_keys[i]], current_data)
                 
                 # Update existing trades
                 self.update_trades(timestamp, current_data)
                 
                 # Update equity curve
                 if i % 100 == 0:  # Update every 100 bars to avoid too much data
-                    self.equity_curve.append({
-                        'timestamp': timestamp,
-                        'balance': self.current_balance,
-                        'trade_pnl': 0,
-                        'cumulative_pnl': self.current_balance - self.initial_balance
-                    })
+                    self._record_equity(timestamp)
+                
+                i += 1
             
             # Calculate performance metrics
             metrics = self._calculate_performance_metrics()
@@ -412,17 +459,16 @@ class BacktestEngine:
             
             # Basic metrics
             total_trades = len(closed_trades)
-            winning_trades = len([t for t in closed_trades if t.pnl > 0])
-            losing_trades = len([t for t in closed_trades if t.pnl < 0])
+            wins = [t.pnl for t in closed_trades if t.pnl > 0]
+            losses = [t.pnl for t in closed_trades if t.pnl < 0]
+            winning_trades = len(wins)
+            losing_trades = len(losses)
             win_rate = winning_trades / total_trades if total_trades > 0 else 0
             
             # P&L metrics
             total_pnl = sum(t.pnl for t in closed_trades)
             total_pnl_pips = sum(t.pnl_pips for t in closed_trades)
             
-            wins = [t.pnl for t in closed_trades if t.pnl > 0]
-            losses = [t.pnl for t in closed_trades if t.pnl < 0]
-            
             avg_win = np.mean(wins) if wins else 0
             avg_loss = abs(np.mean(losses)) if losses else 0
             
@@ -630,8 +676,7 @@ class BacktestEngine:
                             for k, v in metrics.__dict__.items()
                         }
                 
-                with open(filename, 'w') as f:
-                    json.dump(results, f, indent=2, default=str)
+                dump_json(results, filename)
                     
             elif filename.endswith('.csv'):
                 # Export trades to CSV
@@ -6,8 +6,49 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 import logging
+from functools import lru_cache
 from ..config.settings import Timeframe
 
+
+def _mock_ohlc_loop(base_price, noise, open_, high, low, close):
+    """Single pass over the mock bars, writing straight into the record fields"""
+    price = base_price
+    for i in range(noise.shape[1]):
+        price += noise[0, i]
+        open_[i] = price
+        high[i] = price + abs(noise[1, i])
+        low[i] = price - abs(noise[2, i])
+        close[i] = price + noise[3, i]
+
+
+@lru_cache(maxsize=None)
+def _compiled_mock_ohlc_loop():
+    """
+    numba-compiled _mock_ohlc_loop, or None if numba is not installed
+    
+    numba is imported on the first mock fetch rather than with the package,
+    so importing smc_forez does not pay its start-up cost.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_mock_ohlc_loop)
+
+
+def _mock_ohlc(base_price, noise, rates):
+    """Fill open/high/low/close of the mock bars from a (4, n) block of scaled noise"""
+    kernel = _compiled_mock_ohlc_loop()
+    if kernel is not None:
+        kernel(base_price, noise, rates['open'], rates['high'], rates['low'], rates['close'])
+        return
+    prices = base_price + np.cumsum(noise[0])
+    rates['open'] = prices
+    rates['high'] = prices + np.abs(noise[1])
+    rates['low'] = prices - np.abs(noise[2])
+    rates['close'] = prices + noise[3]
+
+
 # Try to import MetaTrader5 - graceful fallback if not available
 try:
     import MetaTrader5 as mt5
@@ -38,34 +79,20 @@ except ImportError:
                                 periods=count, freq='H')
             base_price = 1.0850 if 'USD' in symbol else 1.2500
             
-            # Generate realistic OHLC data
-            returns = np.random.normal(0, 0.001, count)
-            prices = base_price + np.cumsum(returns)
+            # Generate realistic OHLC data, filling each field for all bars at once
+            # from one block of noise (rows: returns, high, low and close offsets)
+            noise = np.random.standard_normal((4, count))
+            noise *= np.array([[0.001], [0.0005], [0.0005], [0.0003]])
             
-            data = []
-            for i, (date, price) in enumerate(zip(dates, prices)):
-                open_price = price
-                high_price = price + abs(np.random.normal(0, 0.0005))
-                low_price = price - abs(np.random.normal(0, 0.0005))
-                close_price = price + np.random.normal(0, 0.0003)
-                
-                data.append({
-                    'time': int(date.timestamp()),
-                    'open': open_price,
-                    'high': high_price, 
-                    'low': low_price,
-                    'close': close_price,
-                    'tick_volume': np.random.randint(100, 1000),
-                    'spread': 2,
-                    'real_volume': 0
-                })
+            rates = np.zeros(count, dtype=[('time', '<i8'), ('open', '<f8'), ('high', '<f8'), 
+                                           ('low', '<f8'), ('close', '<f8'), ('tick_volume', '<i8'),
+                                           ('spread', '<i4'), ('real_volume', '<i8')])
+            rates['time'] = dates.asi8 // 10**9
+            _mock_ohlc(base_price, noise, rates)
+            rates['tick_volume'] = np.random.randint(100, 1000, count)
+            rates['spread'] = 2
             
-            return np.array([(d['time'], d['open'], d['high'], d['low'], 
-                            d['close'], d['tick_volume'], d['spread'], d['real_volume'])
-                           for d in data],
-                          dtype=[('time', '<i8'), ('open', '<f8'), ('high', '<f8'), 
-                                ('low', '<f8'), ('close', '<f8'), ('tick_volume', '<i8'),
-                                ('spread', '<i4'), ('real_volume', '<i8')])
+            return rates
         
         @staticmethod
         def copy_rates_from(symbol, timeframe, start_date, count):
@@ -3,6 +3,7 @@ Market structure analysis for detecting swing points, trends, and structural cha
 """
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 import logging
@@ -45,33 +46,32 @@ class MarketStructureAnalyzer:
             Dictionary with 'swing_highs' and 'swing_lows' Series
         """
         try:
-            high_col = df['High']
-            low_col = df['Low']
-            
-            # Find swing highs
-            swing_highs = pd.Series(index=df.index, dtype=bool)
-            swing_highs.iloc[:] = False
-            
-            # Find swing lows
-            swing_lows = pd.Series(index=df.index, dtype=bool)
-            swing_lows.iloc[:] = False
-            
-            for i in range(self.swing_length, len(df) - self.swing_length):
-                # Check for swing high
-                current_high = high_col.iloc[i]
-                left_highs = high_col.iloc[i - self.swing_length:i]
-                right_highs = high_col.iloc[i + 1:i + self.swing_length + 1]
-                
-                if (current_high > left_highs.max()) and (current_high > right_highs.max()):
-                    swing_highs.iloc[i] = True
-                
-                # Check for swing low
-                current_low = low_col.iloc[i]
-                left_lows = low_col.iloc[i - self.swing_length:i]
-                right_lows = low_col.iloc[i + 1:i + self.swing_length + 1]
+            highs = df['High'].to_numpy(dtype=float)
+            lows = df['Low'].to_numpy(dtype=float)
+            length = self.swing_length
+            
+            is_swing_high = np.zeros(len(df), dtype=bool)
+            is_swing_low = np.zeros(len(df), dtype=bool)
+            
+            if len(df) > 2 * length:
+                # One row per candidate bar: `length` bars each side of the centre.
+                # fmax/fmin skip NaN the same way Series.max()/min() do
+                high_windows = sliding_window_view(highs, 2 * length + 1)
+                centre_highs = high_windows[:, length]
+                is_swing_high[length:len(df) - length] = (
+                    (centre_highs > np.fmax.reduce(high_windows[:, :length], axis=1)) &
+                    (centre_highs > np.fmax.reduce(high_windows[:, length + 1:], axis=1))
+                )
                 
-                if (current_low < left_lows.min()) and (current_low < right_lows.min()):
-                    swing_lows.iloc[i] = True
+                low_windows = sliding_window_view(lows, 2 * length + 1)
+                centre_lows = low_windows[:, length]
+                is_swing_low[length:len(df) - length] = (
+                    (centre_lows < np.fmin.reduce(low_windows[:, :length], axis=1)) &
+                    (centre_lows < np.fmin.reduce(low_windows[:, length + 1:], axis=1))
+                )
+            
+            swing_highs = pd.Series(is_swing_high, index=df.index)
+            swing_lows = pd.Series(is_swing_low, index=df.index)
             
             logger.info(f"Found {swing_highs.sum()} swing highs and {swing_lows.sum()} swing lows")
             
@@ -205,19 +205,48 @@ class MarketStructureAnalyzer:
             logger.error(f"Error detecting structure breaks: {str(e)}")
             return []
     
-    def get_market_structure_levels(self, df: pd.DataFrame) -> Dict:
+    def window_swing_points(self, swing_points: Dict[str, pd.Series],
+                            start: int, end: int) -> Dict[str, pd.Series]:
+        """
+        Restrict swing points found on a full series to the window [start, end)
+        
+        A bar is a swing using only its `swing_length` neighbours, so the
+        result matches running find_swing_points on the window itself: the
+        full-series flags with the window's edge bars cleared.
+        
+        Args:
+            swing_points: Output of find_swing_points for the full series
+            start: Position of the first bar in the window
+            end: Position one past the last bar in the window
+            
+        Returns:
+            Dictionary with 'swing_highs' and 'swing_lows' Series for the window
+        """
+        window = {}
+        for key in ('swing_highs', 'swing_lows'):
+            flags = swing_points[key].iloc[start:end].copy()
+            flags.iloc[:self.swing_length] = False
+            flags.iloc[max(len(flags) - self.swing_length, 0):] = False
+            window[key] = flags
+        return window
+    
+    def get_market_structure_levels(self, df: pd.DataFrame,
+                                    swing_points: Optional[Dict[str, pd.Series]] = None) -> Dict:
         """
         Get comprehensive market structure analysis
         
         Args:
             df: DataFrame with OHLC data
+            swing_points: Precomputed swing points for `df` (e.g. from
+                window_swing_points); found from `df` when omitted
             
         Returns:
             Dictionary with complete market structure information
         """
         try:
             # Find swing points
-            swing_points = self.find_swing_points(df)
+            if swing_points is None:
+                swing_points = self.find_swing_points(df)
             
             # Identify trend direction
             trend = self.identify_trend_direction(df, swing_points)
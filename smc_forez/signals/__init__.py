@@ -1,8 +1,11 @@
 """Signal generation module"""
-from .signal_generator import SignalGenerator, SignalType, SignalStrength, ConfluenceFactor
+from .signal_generator import (
+    SignalGenerator, SignalType, SignalStrength, ConfluenceFactor, BUY_CODE, SELL_CODE
+)
 from .signal_quality_analyzer import SignalQualityAnalyzer, QualityGrade, TimeframeRole
 
 __all__ = [
     "SignalGenerator", "SignalType", "SignalStrength", "ConfluenceFactor",
+    "BUY_CODE", "SELL_CODE",
     "SignalQualityAnalyzer", "QualityGrade", "TimeframeRole"
 ]
\ No newline at end of file
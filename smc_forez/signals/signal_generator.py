@@ -20,6 +20,13 @@ class SignalType(Enum):
     WAIT = "wait"
 
 
+# Compact int8 side codes for tradable signals, for array storage and
+# cheap comparisons in the backtest engine
+BUY_CODE = np.int8(0)
+SELL_CODE = np.int8(1)
+SIDE_CODES = {SignalType.BUY: BUY_CODE, SignalType.SELL: SELL_CODE}
+
+
 class SignalStrength(Enum):
     WEAK = 1
     MODERATE = 2
@@ -388,6 +395,7 @@ class SignalGenerator:
             
             return {
                 'signal_type': signal_type,
+                'side': SIDE_CODES.get(signal_type),
                 'signal_strength': signal_strength,
                 'entry_strategy': entry_strategy,
                 'confluence_score': confluence['num_factors'],
@@ -55,6 +55,18 @@ class SignalQualityAnalyzer:
         self.min_professional_score = quality_settings.get('min_professional_score', 70)
         self.min_execution_score = quality_settings.get('min_execution_score', 55)
         
+        # Grade cutoffs for searchsorted, which needs them ascending. Settings
+        # need not be ordered, so each cutoff is lowered to the smallest one at
+        # or above its grade: a score then gets the highest grade whose own
+        # threshold it meets, as a top-down threshold check would give
+        cutoffs = np.array([40, self.min_execution_score,
+                            self.min_professional_score,
+                            self.min_institutional_score], dtype=float)
+        self._grade_cutoffs = np.minimum.accumulate(cutoffs[::-1])[::-1]
+        self._grade_ladder = np.array([QualityGrade.POOR, QualityGrade.BASIC,
+                                       QualityGrade.INTERMEDIATE, QualityGrade.PROFESSIONAL,
+                                       QualityGrade.INSTITUTIONAL], dtype=object)
+        
         # Multi-timeframe weights
         self.timeframe_weights = {
             TimeframeRole.HTF: quality_settings.get('htf_weight', 0.4),
@@ -409,7 +421,7 @@ class SignalQualityAnalyzer:
             return {
                 'total_score': round(final_score, 2),
                 'factor_details': factor_details,
-                'factors_present': len([cf for cf in confluence_factors if cf.get('score', 0) > 0])
+                'factors_present': sum(1 for cf in confluence_factors if cf.get('score', 0) > 0)
             }
             
         except Exception as e:
@@ -611,16 +623,25 @@ class SignalQualityAnalyzer:
         Returns:
             QualityGrade enum
         """
-        if total_score >= self.min_institutional_score:
-            return QualityGrade.INSTITUTIONAL
-        elif total_score >= self.min_professional_score:
-            return QualityGrade.PROFESSIONAL
-        elif total_score >= self.min_execution_score:
-            return QualityGrade.INTERMEDIATE
-        elif total_score >= 40:
-            return QualityGrade.BASIC
-        else:
-            return QualityGrade.POOR
+        return self._lookup_grades(total_score)
+    
+    def determine_quality_grades(self, total_scores) -> List[QualityGrade]:
+        """
+        Determine quality grades for a batch of scores in one lookup
+        
+        Args:
+            total_scores: Sequence of total quality scores (0-100)
+            
+        Returns:
+            List of QualityGrade enums, one per score
+        """
+        return self._lookup_grades(total_scores).tolist()
+    
+    def _lookup_grades(self, total_scores) -> np.ndarray:
+        """Map scores onto _grade_ladder; NaN scores grade as POOR"""
+        scores = np.asarray(total_scores, dtype=float)
+        idx = np.searchsorted(self._grade_cutoffs, scores, side='right')
+        return self._grade_ladder[np.where(np.isnan(scores), 0, idx)]
     
     def analyze_signal_quality(self, signal: Dict, timeframe_analyses: Dict, 
                               symbol: str) -> Dict:
@@ -3,6 +3,7 @@ Utility modules for SMC Forez
 """
 
 from .multi_timeframe import MultiTimeframeAnalyzer
+from .json_io import dump_json, load_json, json_default
 
 # Optional imports with graceful fallback
 try:
@@ -21,7 +22,7 @@ except ImportError:
     VISUALIZATION_AVAILABLE = False
 
 # Export based on what's available
-__all__ = ['MultiTimeframeAnalyzer']
+__all__ = ['MultiTimeframeAnalyzer', 'dump_json', 'load_json', 'json_default']
 
 if LOGGING_AVAILABLE:
     __all__.extend(['SMCLogger', 'get_logger', 'cleanup_logger'])
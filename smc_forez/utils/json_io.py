@@ -0,0 +1,85 @@
+"""
+JSON read and export helpers with an optional orjson fast path
+"""
+import json
+import math
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable
+
+import numpy as np
+
+# Try to import orjson - graceful fallback to the standard library if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Datetimes and dataclasses go through `default` as they do with json.dump
+    ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                      orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_default(obj: Any) -> Any:
+    """Convert a value JSON cannot encode directly (enums, datetimes, numpy values)"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of `obj` with NaN/inf floats replaced by None, as orjson writes them"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key.value if isinstance(key, Enum) else key: _finite(value)
+                for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def dump_json(obj: Any, filepath, default: Callable[[Any], Any] = json_default):
+    """
+    Write `obj` to `filepath` as UTF-8 JSON indented by two spaces
+
+    Uses orjson when it is installed and the standard json module otherwise.
+    Both paths pass the same values through `default`, write enums by value
+    and write NaN/inf as null, so the file decodes to the same data either way.
+
+    Args:
+        obj: JSON-compatible data to write
+        filepath: Destination file path
+        default: Fallback converter for unsupported objects; enums must map
+            to their value, as orjson encodes them natively
+    """
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(obj, default=default, option=ORJSON_OPTIONS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(_finite(obj), f, indent=2, ensure_ascii=False, allow_nan=False,
+                      default=lambda value: _finite(default(value)))
+
+
+def load_json(f) -> Any:
+    """
+    Parse JSON from a file opened in binary mode
+
+    Uses orjson when it is installed and the standard json module otherwise.
+
+    Args:
+        f: Binary file object to read the document from
+
+    Returns:
+        The decoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(f.read())
+    return json.load(f)
@@ -9,7 +9,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 import sys
 import os
 
@@ -66,6 +66,14 @@ class SessionReport:
     uptime_minutes: float = 0.0
 
 
+def _logs_to_frame(logs: List[Any], log_cls: type) -> pd.DataFrame:
+    """Build a DataFrame of log records column by column (one list per field)"""
+    return pd.DataFrame({
+        field.name: [getattr(log, field.name) for log in logs]
+        for field in fields(log_cls)
+    })
+
+
 class SMCLogger:
     """
     Professional logging system for SMC Forez with multiple output formats
@@ -151,21 +159,22 @@ class SMCLogger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(error_handler)
     
-    def info(self, message: str):
+    # Extra args are %-style and only formatted if the record is emitted
+    def info(self, message: str, *args):
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
         self.session_report.errors_count += 1
     
     def log_signal(self, signal_data: Dict):
@@ -313,7 +322,7 @@ class SMCLogger:
         """Save signals to CSV file"""
         try:
             if self.signal_logs:
-                df = pd.DataFrame([asdict(log) for log in self.signal_logs])
+                df = _logs_to_frame(self.signal_logs, SignalLog)
                 df.to_csv(self.signals_csv, index=False)
         except Exception as e:
             self.error(f"Error saving signals CSV: {str(e)}")
@@ -322,7 +331,7 @@ class SMCLogger:
         """Save trades to CSV file"""
         try:
             if self.trade_logs:
-                df = pd.DataFrame([asdict(log) for log in self.trade_logs])
+                df = _logs_to_frame(self.trade_logs, TradeLog)
                 df.to_csv(self.trades_csv, index=False)
         except Exception as e:
             self.error(f"Error saving trades CSV: {str(e)}")
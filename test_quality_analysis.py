@@ -127,6 +127,43 @@ def test_signal_quality_analyzer():
         return False
 
 
+def test_quality_grade_lookup():
+    """Test batch grading and grading with unordered score thresholds"""
+    print("\n" + "="*60)
+    print("TESTING QUALITY GRADE LOOKUP")
+    print("="*60)
+    
+    from smc_forez.signals.signal_quality_analyzer import SignalQualityAnalyzer, QualityGrade
+    
+    # Batch grading agrees with grading one score at a time
+    analyzer = SignalQualityAnalyzer({})
+    scores = [90, 75, 60, 45, 30, float('nan')]
+    batch_grades = analyzer.determine_quality_grades(scores)
+    assert batch_grades == [analyzer.determine_quality_grade(score) for score in scores], \
+        "Batch grading mismatch"
+    print(f"✓ Batch grading matches for {len(batch_grades)} scores")
+    
+    # Thresholds out of order: the highest grade whose threshold is met wins
+    analyzer = SignalQualityAnalyzer({
+        'min_institutional_score': 60.0,
+        'min_professional_score': 70.0,
+        'min_execution_score': 55.0
+    })
+    expected = [
+        (75, QualityGrade.INSTITUTIONAL),
+        (65, QualityGrade.INSTITUTIONAL),
+        (57, QualityGrade.INTERMEDIATE),
+        (45, QualityGrade.BASIC),
+        (30, QualityGrade.POOR)
+    ]
+    for score, expected_grade in expected:
+        grade = analyzer.determine_quality_grade(score)
+        print(f"✓ Score {score} → {grade.value} (expected: {expected_grade.value})")
+        assert grade == expected_grade, f"Expected {expected_grade.value}, got {grade.value}"
+    
+    return True
+
+
 def test_enhanced_analyzer():
     """Test the enhanced SMC analyzer with quality analysis"""
     print("\n" + "="*60)
@@ -260,7 +297,7 @@ def test_opportunities_scanning():
         
         print(f"Scanning {len(test_symbols)} symbols with quality analysis...")
         opportunities = analyzer.get_current_opportunities(
-            test_symbols, timeframes, use_quality_analysis=True
+            test_symbols, timeframes, use_quality_analysis=True, max_workers=len(test_symbols)
         )
         
         print(f"✓ Found {len(opportunities)} opportunities")
@@ -295,6 +332,7 @@ def main():
     tests = [
         ("Quality Settings Configuration", test_quality_settings),
         ("Signal Quality Analyzer", test_signal_quality_analyzer),
+        ("Quality Grade Lookup", test_quality_grade_lookup),
         ("Enhanced Analyzer", test_enhanced_analyzer),
         ("Institutional-Grade Analysis", test_institutional_grade_analysis),
         ("Enhanced Opportunities Scanning", test_opportunities_scanning)